@@ -5,6 +5,7 @@ PostgreSQL-only implementation using asyncpg.
 
 import os
 import asyncpg
+from functools import lru_cache
 from typing import Optional, Any, List, Dict
 from contextlib import asynccontextmanager
 
@@ -18,6 +19,16 @@ if not DATABASE_URL:
         "For production, this should be set by your hosting provider (e.g., Render)."
     )
 
+# Connections kept open in the pool; warm connections skip the connect
+# handshake on bursts and let concurrent queries start immediately
+DB_POOL_MIN_SIZE = int(os.getenv("DB_POOL_MIN_SIZE", min(os.cpu_count() or 1, 8)))
+DB_POOL_MAX_SIZE = int(os.getenv("DB_POOL_MAX_SIZE", 10))
+
+# Prepared statements kept per pooled connection, keyed by SQL text. The routes
+# issue well over asyncpg's default of 100 distinct statements, so a smaller
+# cache keeps evicting hot queries and re-preparing them
+DB_STATEMENT_CACHE_SIZE = int(os.getenv("DB_STATEMENT_CACHE_SIZE", 256))
+
 # PostgreSQL Schema
 POSTGRES_SCHEMA = """
 -- Users table for authentication (must be first due to foreign key references)
@@ -61,6 +72,8 @@ CREATE INDEX IF NOT EXISTS idx_expenses_date ON expenses(date);
 CREATE INDEX IF NOT EXISTS idx_expenses_category ON expenses(category);
 CREATE INDEX IF NOT EXISTS idx_expenses_created_at ON expenses(created_at);
 CREATE INDEX IF NOT EXISTS idx_expenses_user_id ON expenses(user_id);
+CREATE INDEX IF NOT EXISTS idx_expenses_user_cat_date ON expenses(user_id, category, date) INCLUDE (amount);
+CREATE INDEX IF NOT EXISTS idx_expenses_user_date ON expenses(user_id, date) INCLUDE (category, amount);
 
 -- Budgets table
 CREATE TABLE IF NOT EXISTS budgets (
@@ -129,6 +142,7 @@ CREATE TABLE IF NOT EXISTS goal_contributions (
 CREATE INDEX IF NOT EXISTS idx_contributions_goal ON goal_contributions(goal_id);
 CREATE INDEX IF NOT EXISTS idx_goals_completed ON savings_goals(is_completed);
 CREATE INDEX IF NOT EXISTS idx_goals_user_id ON savings_goals(user_id);
+CREATE INDEX IF NOT EXISTS idx_goals_user_active ON savings_goals(user_id, is_completed, target_date);
 
 -- Spending Alerts table
 CREATE TABLE IF NOT EXISTS alerts (
@@ -205,6 +219,7 @@ CREATE TABLE IF NOT EXISTS subscriptions (
 CREATE INDEX IF NOT EXISTS idx_subscriptions_next_renewal ON subscriptions(next_renewal);
 CREATE INDEX IF NOT EXISTS idx_subscriptions_is_active ON subscriptions(is_active);
 CREATE INDEX IF NOT EXISTS idx_subscriptions_user_id ON subscriptions(user_id);
+CREATE INDEX IF NOT EXISTS idx_subscriptions_user_active ON subscriptions(user_id, is_active, next_renewal);
 
 -- Incomes table
 CREATE TABLE IF NOT EXISTS incomes (
@@ -247,36 +262,39 @@ CATEGORIES_DATA = [
 
 
 class PostgresRowProxy:
-    """Wrapper to make asyncpg Record behave like a dict-compatible row."""
+    """
+    Wrapper to make asyncpg Record behave like a dict-compatible row.
+    Lookups go straight to the C-level Record; key lists are only built when asked for.
+    """
+    __slots__ = ("_record",)
+    
     def __init__(self, record: asyncpg.Record):
         self._record = record
-        self._keys = list(record.keys()) if record else []
     
     def __getitem__(self, key):
-        if isinstance(key, int):
-            return self._record[key]
         return self._record[key]
     
     def keys(self):
-        return self._keys
+        return list(self._record.keys())
     
     def __iter__(self):
-        return iter(self._keys)
+        return iter(self._record.keys())
     
     def items(self):
         """Support dict(row) conversion."""
-        return [(k, self._record[k]) for k in self._keys]
+        return list(self._record.items())
     
     def values(self):
         """Support dict(row) conversion."""
-        return [self._record[k] for k in self._keys]
+        return list(self._record.values())
 
 
 class PostgresCursorProxy:
     """Wrapper to simulate cursor behavior for PostgreSQL."""
-    def __init__(self, result=None, lastrowid=None):
+    def __init__(self, result=None, lastrowid=None, rowcount=-1):
         self._result = result
         self.lastrowid = lastrowid
+        self.rowcount = rowcount
     
     async def fetchone(self):
         if self._result and len(self._result) > 0:
@@ -309,7 +327,8 @@ class PostgresConnectionWrapper:
             await self.pool.release(self._conn)
             self._conn = None
     
-    def _convert_placeholders(self, sql: str) -> str:
+    @staticmethod
+    def _convert_placeholders(sql: str) -> str:
         """Convert ? placeholders to $1, $2, etc. for PostgreSQL."""
         result = []
         param_count = 0
@@ -323,7 +342,8 @@ class PostgresConnectionWrapper:
             i += 1
         return ''.join(result)
     
-    def _convert_sqlite_syntax(self, sql: str) -> str:
+    @staticmethod
+    def _convert_sqlite_syntax(sql: str) -> str:
         """Convert SQLite-specific syntax to PostgreSQL."""
         import re
         
@@ -357,6 +377,20 @@ class PostgresConnectionWrapper:
         
         return sql
     
+    @staticmethod
+    @lru_cache(maxsize=512)
+    def _translate(sql: str) -> str:
+        """
+        Convert SQLite syntax and placeholders, memoized by SQL text.
+        
+        Routes pass the same literal strings on every call, so each statement
+        is rewritten once and then reaches asyncpg as identical text, which
+        also keeps its prepared-statement cache hitting.
+        """
+        return PostgresConnectionWrapper._convert_placeholders(
+            PostgresConnectionWrapper._convert_sqlite_syntax(sql)
+        )
+    
     def _is_insert(self, sql: str) -> bool:
         """Check if SQL is an INSERT statement."""
         return sql.strip().upper().startswith('INSERT')
@@ -371,13 +405,12 @@ class PostgresConnectionWrapper:
     async def execute(self, sql: str, parameters: tuple = None) -> PostgresCursorProxy:
         """Execute a SQL statement and return a cursor-like object."""
         original_sql = sql
-        # Convert SQLite-specific syntax
-        sql = self._convert_sqlite_syntax(sql)
-        # Convert placeholders
-        sql = self._convert_placeholders(sql)
+        # Convert SQLite-specific syntax and placeholders
+        sql = self._translate(sql)
         
         lastrowid = None
         result = None
+        rowcount = -1
         
         if self._is_insert(original_sql):
             sql = self._add_returning(sql)
@@ -386,6 +419,7 @@ class PostgresConnectionWrapper:
                     row = await self._conn.fetchrow(sql, *parameters)
                 else:
                     row = await self._conn.fetchrow(sql)
+                rowcount = 1 if row else 0
                 if row and 'id' in row.keys():
                     lastrowid = row['id']
                     result = [row]
@@ -395,21 +429,38 @@ class PostgresConnectionWrapper:
                     pass
                 else:
                     raise
-        elif original_sql.strip().upper().startswith('SELECT'):
-            # SELECT queries - fetch all results
+        elif original_sql.strip().upper().startswith(('SELECT', 'WITH')):
+            # SELECT queries (including CTEs) - fetch all results
             if parameters:
                 rows = await self._conn.fetch(sql, *parameters)
             else:
                 rows = await self._conn.fetch(sql)
             result = rows if rows else []
+            rowcount = len(result)
         else:
             # UPDATE, DELETE, etc.
             if parameters:
-                await self._conn.execute(sql, *parameters)
+                status = await self._conn.execute(sql, *parameters)
             else:
-                await self._conn.execute(sql)
+                status = await self._conn.execute(sql)
+            # Command tag such as "UPDATE 3" carries the affected row count
+            tag_count = status.rsplit(' ', 1)[-1] if status else ''
+            if tag_count.isdigit():
+                rowcount = int(tag_count)
         
-        return PostgresCursorProxy(result, lastrowid)
+        return PostgresCursorProxy(result, lastrowid, rowcount)
+    
+    async def execute_fetchall(self, sql: str, parameters: tuple = None) -> List[PostgresRowProxy]:
+        """Execute a read query and return its rows directly (aiosqlite-compatible shortcut)."""
+        sql = self._translate(sql)
+        rows = await self._conn.fetch(sql, *(parameters or ()))
+        return [PostgresRowProxy(row) for row in rows]
+    
+    async def execute_fetchone(self, sql: str, parameters: tuple = None) -> Optional[PostgresRowProxy]:
+        """Execute a read query and return its first row, or None."""
+        sql = self._translate(sql)
+        row = await self._conn.fetchrow(sql, *(parameters or ()))
+        return PostgresRowProxy(row) if row else None
     
     async def executemany(self, sql: str, parameters: List[tuple]) -> None:
         """Execute a SQL statement with multiple parameter sets."""
@@ -471,7 +522,12 @@ class Database:
     async def connect(self):
         """Initialize database connection and create tables."""
         dsn = self._get_postgres_dsn()
-        self._pg_pool = await asyncpg.create_pool(dsn, min_size=1, max_size=10)
+        self._pg_pool = await asyncpg.create_pool(
+            dsn,
+            min_size=min(DB_POOL_MIN_SIZE, DB_POOL_MAX_SIZE),
+            max_size=DB_POOL_MAX_SIZE,
+            statement_cache_size=DB_STATEMENT_CACHE_SIZE
+        )
         
         # Create tables using a connection from the pool
         async with self._pg_pool.acquire() as conn:
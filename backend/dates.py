@@ -0,0 +1,15 @@
+"""
+Calendar helpers shared by the analytics, alerts and income routes.
+"""
+
+from calendar import monthrange
+from datetime import date
+from functools import lru_cache
+from typing import Tuple
+
+
+@lru_cache(maxsize=64)
+def month_bounds(year: int, month: int) -> Tuple[date, date, int]:
+    """Return (first_day, last_day, days_in_month) for a calendar month."""
+    days_in_month = monthrange(year, month)[1]
+    return date(year, month, 1), date(year, month, days_in_month), days_in_month
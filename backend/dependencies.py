@@ -5,33 +5,43 @@ PostgreSQL-only implementation.
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from typing import Optional, Any
+from typing import Optional, Any, Tuple
 
 from database import get_db
-from services.auth import decode_token, get_user_by_id
+from services.auth import decode_token, get_cached_user
 
 security = HTTPBearer(auto_error=False)
 
 
-async def get_current_user(
-    credentials: Optional[HTTPAuthorizationCredentials] = Depends(security),
-    db: Any = Depends(get_db)
-) -> Optional[dict]:
-    """Get current user from JWT token. Returns None if not authenticated."""
+async def _authenticate(
+    credentials: Optional[HTTPAuthorizationCredentials],
+    db: Any
+) -> Tuple[Optional[dict], Optional[str]]:
+    """Resolve the bearer token to a user. Returns (user, None) or (None, reason)."""
     if not credentials:
-        return None
-    
-    token = credentials.credentials
-    payload = decode_token(token)
+        return None, "Not authenticated"
     
+    payload = decode_token(credentials.credentials)
     if not payload:
-        return None
+        return None, "Invalid or expired token"
     
     user_id = payload.get("sub")
     if not user_id:
-        return None
+        return None, "Invalid token payload"
+    
+    user = await get_cached_user(db, int(user_id))
+    if not user:
+        return None, "User not found"
     
-    user = await get_user_by_id(db, int(user_id))
+    return user, None
+
+
+async def get_current_user(
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(security),
+    db: Any = Depends(get_db)
+) -> Optional[dict]:
+    """Get current user from JWT token. Returns None if not authenticated."""
+    user, _ = await _authenticate(credentials, db)
     return user
 
 
@@ -40,35 +50,12 @@ async def require_auth(
     db: Any = Depends(get_db)
 ) -> dict:
     """Require authentication. Raises 401 if not authenticated."""
-    if not credentials:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Not authenticated",
-            headers={"WWW-Authenticate": "Bearer"}
-        )
-    
-    token = credentials.credentials
-    payload = decode_token(token)
-    
-    if not payload:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid or expired token",
-            headers={"WWW-Authenticate": "Bearer"}
-        )
-    
-    user_id = payload.get("sub")
-    if not user_id:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid token payload"
-        )
-    
-    user = await get_user_by_id(db, int(user_id))
+    user, reason = await _authenticate(credentials, db)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="User not found"
+            detail=reason,
+            headers={"WWW-Authenticate": "Bearer"}
         )
     
     return user
@@ -0,0 +1,71 @@
+"""
+ETags for GET routes derived from a user's own data.
+
+A route depends on user_data_etag to get a conditional-GET tag for the
+current request, and uses ETagRoute as its route class so the tag is
+stamped onto successful responses.
+"""
+
+from datetime import date
+from typing import Callable
+import hashlib
+
+from fastapi import Depends, HTTPException, Request, Response
+from fastapi.routing import APIRoute
+import aiosqlite
+
+from database import get_db
+from dependencies import require_auth
+
+# Derived responses are built from these per-user tables; any write to them
+# changes at least one of the counts, max ids or max updated_at values
+_USER_DATA_FINGERPRINT_SQL = """
+SELECT
+    (SELECT COUNT(*) FROM expenses WHERE user_id = ?) as expense_count,
+    (SELECT MAX(id) FROM expenses WHERE user_id = ?) as last_expense_id,
+    (SELECT MAX(updated_at) FROM expenses WHERE user_id = ?) as expenses_updated,
+    (SELECT COUNT(*) FROM budgets WHERE user_id = ?) as budget_count,
+    (SELECT MAX(updated_at) FROM budgets WHERE user_id = ?) as budgets_updated,
+    (SELECT COUNT(*) FROM incomes WHERE user_id = ?) as income_count,
+    (SELECT MAX(id) FROM incomes WHERE user_id = ?) as last_income_id,
+    (SELECT COUNT(*) FROM savings_goals WHERE user_id = ?) as goal_count,
+    (SELECT MAX(updated_at) FROM savings_goals WHERE user_id = ?) as goals_updated
+"""
+
+
+async def user_data_etag(
+    request: Request,
+    db: aiosqlite.Connection = Depends(get_db),
+    user: dict = Depends(require_auth)
+) -> str:
+    """
+    Compute the ETag for a GET and answer 304 when the client already has it.
+    
+    The tag covers the user's data fingerprint, today's date (default ranges move
+    with it) and the full URL, so each query-string variant gets its own tag.
+    It is stored on request.state.etag, where response caches key on it.
+    """
+    row = await db.execute_fetchone(_USER_DATA_FINGERPRINT_SQL, (user["id"],) * 9)
+    fingerprint = (user["id"], date.today(), str(request.url), *(row[key] for key in row.keys()))
+    etag = '"%s"' % hashlib.blake2b(repr(fingerprint).encode(), digest_size=8).hexdigest()
+    
+    if request.headers.get("if-none-match") == etag:
+        raise HTTPException(status_code=304, headers={"ETag": etag})
+    request.state.etag = etag
+    return etag
+
+
+class ETagRoute(APIRoute):
+    """Route class that stamps the ETag from user_data_etag onto successful responses."""
+    
+    def get_route_handler(self) -> Callable:
+        handler = super().get_route_handler()
+        
+        async def route_handler(request: Request) -> Response:
+            response = await handler(request)
+            etag = getattr(request.state, "etag", None)
+            if etag and response.status_code == 200:
+                response.headers["ETag"] = etag
+            return response
+        
+        return route_handler
@@ -5,17 +5,66 @@ Provides consistent, JSON-formatted logging across the application
 with request tracing and contextual information.
 """
 
+import copy
+import functools
 import logging
+import queue
 import sys
 import json
-from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener
+from datetime import datetime, timezone
 from typing import Any, Optional
+from contextlib import contextmanager
 from contextvars import ContextVar
 import os
 
 # Context variable for request ID tracking
 request_id_var: ContextVar[Optional[str]] = ContextVar('request_id', default=None)
 
+# Standard LogRecord attributes; anything else on a record came from `extra`
+_STD_LOGRECORD_ATTRS = frozenset({
+    'name', 'msg', 'args', 'created', 'levelname', 'levelno',
+    'pathname', 'filename', 'module', 'exc_info', 'exc_text',
+    'stack_info', 'lineno', 'funcName', 'message', 'msecs',
+    'relativeCreated', 'thread', 'threadName', 'processName',
+    'process', 'taskName', 'request_id',
+})
+
+# Accepted LOG_LEVEL names
+_LEVELS = {
+    'DEBUG': logging.DEBUG,
+    'INFO': logging.INFO,
+    'WARNING': logging.WARNING,
+    'ERROR': logging.ERROR,
+    'CRITICAL': logging.CRITICAL,
+}
+
+# Background listener that owns the real stream handler
+_listener: Optional[QueueListener] = None
+
+
+def _record_request_id(record: logging.LogRecord) -> Optional[str]:
+    """Request ID captured at enqueue time, falling back to the current context."""
+    if "request_id" in record.__dict__:
+        return record.request_id
+    return request_id_var.get()
+
+
+class ContextQueueHandler(QueueHandler):
+    """
+    Queue handler that captures the request ID before handing off the record.
+    The listener thread formats records outside the request's context, so
+    the ContextVar value has to travel on the record itself.
+    """
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.request_id = request_id_var.get()
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        return record
+
 
 class JSONFormatter(logging.Formatter):
     """
@@ -25,14 +74,15 @@ class JSONFormatter(logging.Formatter):
     
     def format(self, record: logging.LogRecord) -> str:
         log_entry = {
-            "timestamp": datetime.utcnow().isoformat() + "Z",
+            # Time the record was logged; formatting happens later on the listener thread
+            "timestamp": datetime.fromtimestamp(record.created, timezone.utc).isoformat().replace("+00:00", "Z"),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
         }
         
         # Add request ID if available
-        request_id = request_id_var.get()
+        request_id = _record_request_id(record)
         if request_id:
             log_entry["request_id"] = request_id
         
@@ -48,18 +98,9 @@ class JSONFormatter(logging.Formatter):
             log_entry["exception"] = self.formatException(record.exc_info)
         
         # Add any extra fields
-        extra_fields = {
-            key: value for key, value in record.__dict__.items()
-            if key not in {
-                'name', 'msg', 'args', 'created', 'levelname', 'levelno',
-                'pathname', 'filename', 'module', 'exc_info', 'exc_text',
-                'stack_info', 'lineno', 'funcName', 'message', 'msecs',
-                'relativeCreated', 'thread', 'threadName', 'processName',
-                'process', 'taskName'
-            }
-        }
-        if extra_fields:
-            log_entry["extra"] = extra_fields
+        extra_keys = record.__dict__.keys() - _STD_LOGRECORD_ATTRS
+        if extra_keys:
+            log_entry["extra"] = {key: record.__dict__[key] for key in extra_keys}
         
         return json.dumps(log_entry)
 
@@ -79,15 +120,34 @@ class DevelopmentFormatter(logging.Formatter):
     }
     RESET = '\033[0m'
     
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Per-level "<color>{ts} LEVEL   <reset>" templates, built once
+        self._level_templates = {
+            level: f"{color}{{ts}} {level:8}{self.RESET}"
+            for level, color in self.COLORS.items()
+        }
+        self._ts_second = None
+        self._ts_text = ""
+    
+    def _timestamp(self, created: float) -> str:
+        """Format HH:MM:SS, reusing the last result within the same second."""
+        second = int(created)
+        if second != self._ts_second:
+            self._ts_second = second
+            self._ts_text = datetime.fromtimestamp(second).strftime("%H:%M:%S")
+        return self._ts_text
+    
     def format(self, record: logging.LogRecord) -> str:
-        color = self.COLORS.get(record.levelname, self.RESET)
-        timestamp = datetime.now().strftime("%H:%M:%S")
+        template = self._level_templates.get(record.levelname)
+        if template is None:
+            template = f"{self.RESET}{{ts}} {record.levelname:8}{self.RESET}"
         
         # Add request ID if available
-        request_id = request_id_var.get()
+        request_id = _record_request_id(record)
         request_part = f" [{request_id[:8]}]" if request_id else ""
         
-        message = f"{color}{timestamp} {record.levelname:8}{self.RESET}{request_part} {record.name}: {record.getMessage()}"
+        message = f"{template.format(ts=self._timestamp(record.created))}{request_part} {record.name}: {record.getMessage()}"
         
         if record.exc_info:
             message += f"\n{self.formatException(record.exc_info)}"
@@ -119,9 +179,10 @@ def setup_logging(
     
     # Get the root logger
     logger = logging.getLogger("finlens")
-    logger.setLevel(getattr(logging, log_level.upper(), logging.INFO))
+    logger.setLevel(_LEVELS.get(log_level.upper(), logging.INFO))
     
     # Remove existing handlers
+    shutdown_logging()
     logger.handlers.clear()
     
     # Create handler
@@ -134,7 +195,13 @@ def setup_logging(
         formatter = DevelopmentFormatter()
     
     handler.setFormatter(formatter)
-    logger.addHandler(handler)
+    
+    # Write to stdout from a background thread so request handlers never block on I/O
+    global _listener
+    log_queue = queue.SimpleQueue()
+    logger.addHandler(ContextQueueHandler(log_queue))
+    _listener = QueueListener(log_queue, handler, respect_handler_level=True)
+    _listener.start()
     
     # Prevent propagation to root logger
     logger.propagate = False
@@ -142,10 +209,29 @@ def setup_logging(
     return logger
 
 
+def shutdown_logging() -> None:
+    """
+    Flush queued records and stop the background log listener.
+    The stream handler is moved back onto the logger, so records logged
+    after shutdown are written directly instead of sitting in the queue.
+    """
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        app_logger = logging.getLogger("finlens")
+        for handler in list(app_logger.handlers):
+            if isinstance(handler, ContextQueueHandler):
+                app_logger.removeHandler(handler)
+        for handler in _listener.handlers:
+            app_logger.addHandler(handler)
+        _listener = None
+
+
 # Create default logger instance
 logger = setup_logging()
 
 
+@functools.lru_cache(maxsize=32)
 def get_logger(name: str = None) -> logging.Logger:
     """
     Get a logger instance with the specified name.
@@ -161,6 +247,11 @@ def get_logger(name: str = None) -> logging.Logger:
     return logger
 
 
+# Loggers used by the structured helpers below
+_ai_logger = get_logger("ai")
+_api_logger = get_logger("api")
+
+
 class LogContext:
     """
     Context manager for adding contextual information to logs.
@@ -170,6 +261,8 @@ class LogContext:
             logger.info("Processing request")
     """
     
+    __slots__ = ("request_id", "extra", "_token")
+    
     def __init__(self, request_id: str = None, **extra):
         self.request_id = request_id
         self.extra = extra
@@ -181,8 +274,25 @@ class LogContext:
         return self
     
     def __exit__(self, *args):
-        if self._token:
+        if self._token is not None:
             request_id_var.reset(self._token)
+            self._token = None
+
+
+@contextmanager
+def log_context(request_id: str):
+    """
+    Lightweight request-ID scope for hot paths such as middleware.
+    
+    Usage:
+        with log_context(request_id):
+            ...
+    """
+    token = request_id_var.set(request_id)
+    try:
+        yield
+    finally:
+        request_id_var.reset(token)
 
 
 def log_ai_operation(
@@ -206,8 +316,7 @@ def log_ai_operation(
         latency_ms: Operation latency
         **extra: Additional metadata
     """
-    ai_logger = get_logger("ai")
-    ai_logger.info(
+    _ai_logger.info(
         f"AI Operation: {operation}",
         extra={
             "ai_operation": operation,
@@ -240,10 +349,9 @@ def log_api_request(
         client_ip: Client IP address
         **extra: Additional metadata
     """
-    api_logger = get_logger("api")
     level = logging.WARNING if status_code >= 400 else logging.INFO
     
-    api_logger.log(
+    _api_logger.log(
         level,
         f"{method} {path} - {status_code}",
         extra={
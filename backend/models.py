@@ -4,48 +4,45 @@ Pydantic models for request/response validation.
 
 from __future__ import annotations
 
-from pydantic import BaseModel, Field, field_validator
-from typing import Optional, List
+from pydantic import BaseModel, ConfigDict, Field, StringConstraints
+from pydantic.dataclasses import dataclass
+from typing import Annotated, Optional, List, Literal
 from datetime import date as DateType, datetime as DateTimeType
-from enum import Enum
 
 
-class CategorizationMethod(str, Enum):
-    """Method used for categorization."""
-    REGEX = "regex"
-    AI = "ai"
-    MANUAL = "manual"
+# Method used for categorization
+CategorizationMethod = Literal["regex", "ai", "manual"]
 
+# Type of AI operation
+OperationType = Literal["categorize", "query", "insight"]
 
-class OperationType(str, Enum):
-    """Type of AI operation."""
-    CATEGORIZE = "categorize"
-    QUERY = "query"
-    INSIGHT = "insight"
+# Text field that is stripped and must not be blank; checked in pydantic-core
+NonEmptyStr = Annotated[str, StringConstraints(strip_whitespace=True, min_length=1)]
+
+
+# Shared config for response models read from database rows
+_ORM_CONFIG = ConfigDict(from_attributes=True)
+
+
+class _Base(BaseModel):
+    """Shared base: schemas are built on first use instead of at import."""
+    model_config = ConfigDict(defer_build=True)
 
 
 # ============================================================================
 # Expense Models
 # ============================================================================
 
-class ExpenseCreate(BaseModel):
+class ExpenseCreate(_Base):
     """Request model for creating an expense."""
     amount: float = Field(..., gt=0, description="Expense amount (must be positive)")
-    description: str = Field(..., min_length=1, max_length=500, description="Expense description")
+    description: NonEmptyStr = Field(..., max_length=500, description="Expense description")
     category: Optional[str] = Field(None, description="Category (if manually specified)")
     date: DateType = Field(..., description="Expense date")
     payment_method: Optional[str] = Field(None, max_length=50, description="Payment method")
-    
-    @field_validator('description')
-    @classmethod
-    def validate_description(cls, v: str) -> str:
-        """Ensure description is not just whitespace."""
-        if not v.strip():
-            raise ValueError("Description cannot be empty or whitespace")
-        return v.strip()
 
 
-class ExpenseResponse(BaseModel):
+class ExpenseResponse(_Base):
     """Response model for expense data."""
     id: int
     amount: float
@@ -67,11 +64,10 @@ class ExpenseResponse(BaseModel):
     created_at: DateTimeType
     updated_at: DateTimeType
     
-    class Config:
-        from_attributes = True
+    model_config = _ORM_CONFIG
 
 
-class ExpenseUpdate(BaseModel):
+class ExpenseUpdate(_Base):
     """Request model for updating an expense."""
     amount: Optional[float] = Field(None, gt=0)
     description: Optional[str] = Field(None, min_length=1, max_length=500)
@@ -84,7 +80,7 @@ class ExpenseUpdate(BaseModel):
 # Category Models
 # ============================================================================
 
-class CategorySuggestion(BaseModel):
+class CategorySuggestion(_Base):
     """AI category suggestion with confidence."""
     category: str
     confidence: float = Field(..., ge=0.0, le=1.0, description="Confidence score (0-1)")
@@ -92,7 +88,7 @@ class CategorySuggestion(BaseModel):
     reasoning: Optional[str] = Field(None, description="Explanation for the suggestion")
 
 
-class CategoryResponse(BaseModel):
+class CategoryResponse(_Base):
     """Response model for category data."""
     id: int
     name: str
@@ -100,21 +96,20 @@ class CategoryResponse(BaseModel):
     color: str
     description: str
     
-    class Config:
-        from_attributes = True
+    model_config = _ORM_CONFIG
 
 
 # ============================================================================
 # Budget Models
 # ============================================================================
 
-class BudgetCreate(BaseModel):
+class BudgetCreate(_Base):
     """Request model for creating a budget."""
     category: str
     monthly_limit: float = Field(..., gt=0, description="Monthly budget limit")
 
 
-class BudgetResponse(BaseModel):
+class BudgetResponse(_Base):
     """Response model for budget data."""
     id: int
     category: str
@@ -122,11 +117,10 @@ class BudgetResponse(BaseModel):
     created_at: DateTimeType
     updated_at: DateTimeType
     
-    class Config:
-        from_attributes = True
+    model_config = _ORM_CONFIG
 
 
-class BudgetStatus(BaseModel):
+class BudgetStatus(_Base):
     """Budget status with spending information."""
     category: str
     monthly_limit: float
@@ -141,19 +135,19 @@ class BudgetStatus(BaseModel):
 # Natural Language Query Models
 # ============================================================================
 
-class ChatMessage(BaseModel):
+class ChatMessage(_Base):
     """A single message in conversation history."""
     role: str = Field(..., description="Role: 'user' or 'assistant'")
     content: str = Field(..., description="Message content")
 
 
-class NLQueryRequest(BaseModel):
+class NLQueryRequest(_Base):
     """Request model for natural language query."""
     query: str = Field(..., min_length=1, max_length=500, description="Natural language query")
     conversation_history: Optional[List[ChatMessage]] = Field(default=None, description="Previous messages for context")
 
 
-class NLQueryResponse(BaseModel):
+class NLQueryResponse(_Base):
     """Response model for natural language query results."""
     query: str
     intent: str
@@ -167,7 +161,8 @@ class NLQueryResponse(BaseModel):
 # Insight Models
 # ============================================================================
 
-class DataSource(BaseModel):
+@dataclass(frozen=True, slots=True)
+class DataSource:
     """Reference to data source for insight."""
     expense_id: int
     amount: float
@@ -175,7 +170,7 @@ class DataSource(BaseModel):
     date: DateType
 
 
-class InsightResponse(BaseModel):
+class InsightResponse(_Base):
     """Response model for AI-generated insight."""
     type: str
     title: str
@@ -189,7 +184,7 @@ class InsightResponse(BaseModel):
 # Audit Log Models
 # ============================================================================
 
-class AuditLogEntry(BaseModel):
+class AuditLogEntry(_Base):
     """Audit log entry for AI operations."""
     id: int
     expense_id: Optional[int]
@@ -203,15 +198,14 @@ class AuditLogEntry(BaseModel):
     latency_ms: Optional[int]
     timestamp: DateTimeType
     
-    class Config:
-        from_attributes = True
+    model_config = _ORM_CONFIG
 
 
 # ============================================================================
 # Analytics Models
 # ============================================================================
 
-class SpendingByCategory(BaseModel):
+class SpendingByCategory(_Base):
     """Spending aggregated by category."""
     category: str
     total: float
@@ -219,13 +213,14 @@ class SpendingByCategory(BaseModel):
     percentage: float
 
 
-class SpendingTrend(BaseModel):
+@dataclass(frozen=True, slots=True)
+class SpendingTrend:
     """Spending trend over time."""
     date: DateType
     total: float
 
 
-class AnalyticsSummary(BaseModel):
+class AnalyticsSummary(_Base):
     """Overall analytics summary."""
     total_expenses: float
     expense_count: int
@@ -236,7 +231,8 @@ class AnalyticsSummary(BaseModel):
     date_range_end: DateType
 
 
-class CategoryBudgetStatus(BaseModel):
+@dataclass(frozen=True, slots=True)
+class CategoryBudgetStatus:
     """Budget status for a specific category."""
     category: str
     limit: float
@@ -246,7 +242,7 @@ class CategoryBudgetStatus(BaseModel):
     status: str  # 'safe', 'warning', 'exceeded'
 
 
-class SafeToSpendResponse(BaseModel):
+class SafeToSpendResponse(_Base):
     """Safe to spend calculation response."""
     safe_to_spend_today: float = Field(..., description="Amount safe to spend today")
     total_budget: float = Field(..., description="Total monthly budget across all categories")
@@ -270,24 +266,16 @@ class SafeToSpendResponse(BaseModel):
 # Savings Goals Models
 # ============================================================================
 
-class GoalCreate(BaseModel):
+class GoalCreate(_Base):
     """Request model for creating a savings goal."""
-    name: str = Field(..., min_length=1, max_length=100, description="Goal name")
+    name: NonEmptyStr = Field(..., max_length=100, description="Goal name")
     target_amount: float = Field(..., gt=0, description="Target savings amount")
     target_date: Optional[DateType] = Field(None, description="Optional target date")
     icon: Optional[str] = Field("🎯", max_length=10, description="Goal icon emoji")
     color: Optional[str] = Field("#6366f1", max_length=20, description="Goal color")
-    
-    @field_validator('name')
-    @classmethod
-    def validate_name(cls, v: str) -> str:
-        """Ensure name is not just whitespace."""
-        if not v.strip():
-            raise ValueError("Name cannot be empty or whitespace")
-        return v.strip()
 
 
-class GoalUpdate(BaseModel):
+class GoalUpdate(_Base):
     """Request model for updating a savings goal."""
     name: Optional[str] = Field(None, min_length=1, max_length=100)
     target_amount: Optional[float] = Field(None, gt=0)
@@ -296,7 +284,7 @@ class GoalUpdate(BaseModel):
     color: Optional[str] = Field(None, max_length=20)
 
 
-class GoalResponse(BaseModel):
+class GoalResponse(_Base):
     """Response model for savings goal data."""
     id: int
     name: str
@@ -314,17 +302,16 @@ class GoalResponse(BaseModel):
     progress_percentage: float
     days_remaining: Optional[int]
     
-    class Config:
-        from_attributes = True
+    model_config = _ORM_CONFIG
 
 
-class ContributionCreate(BaseModel):
+class ContributionCreate(_Base):
     """Request model for adding a contribution to a goal."""
     amount: float = Field(..., gt=0, description="Contribution amount")
     note: Optional[str] = Field(None, max_length=200, description="Optional note")
 
 
-class ContributionResponse(BaseModel):
+class ContributionResponse(_Base):
     """Response model for goal contribution data."""
     id: int
     goal_id: int
@@ -332,22 +319,18 @@ class ContributionResponse(BaseModel):
     note: Optional[str]
     created_at: DateTimeType
     
-    class Config:
-        from_attributes = True
+    model_config = _ORM_CONFIG
 
 
 # ============================================================================
 # Alert Models
 # ============================================================================
 
-class AlertType(str, Enum):
-    """Type of alert."""
-    BUDGET_WARNING = "budget_warning"
-    WEEKLY_SUMMARY = "weekly_summary"
-    GOAL_REACHED = "goal_reached"
+# Type of alert
+AlertType = Literal["budget_warning", "weekly_summary", "goal_reached"]
 
 
-class AlertResponse(BaseModel):
+class AlertResponse(_Base):
     """Response model for alert data."""
     id: int
     type: str
@@ -359,11 +342,10 @@ class AlertResponse(BaseModel):
     is_dismissed: bool
     created_at: DateTimeType
     
-    class Config:
-        from_attributes = True
+    model_config = _ORM_CONFIG
 
 
-class BudgetStatusWithAlert(BaseModel):
+class BudgetStatusWithAlert(_Base):
     """Extended budget status with alert information."""
     category: str
     monthly_limit: float
@@ -376,7 +358,7 @@ class BudgetStatusWithAlert(BaseModel):
     alert_message: Optional[str]
 
 
-class AlertsSummary(BaseModel):
+class AlertsSummary(_Base):
     """Summary of unread alerts."""
     unread_count: int
     alerts: List[AlertResponse]
@@ -386,22 +368,15 @@ class AlertsSummary(BaseModel):
 # Split Bills Models
 # ============================================================================
 
-class FriendCreate(BaseModel):
+class FriendCreate(_Base):
     """Request model for creating a friend."""
-    name: str = Field(..., min_length=1, max_length=100, description="Friend's name")
+    name: NonEmptyStr = Field(..., max_length=100, description="Friend's name")
     email: Optional[str] = Field(None, max_length=100, description="Friend's email")
     phone: Optional[str] = Field(None, max_length=20, description="Friend's phone")
     avatar_color: Optional[str] = Field("#6366f1", max_length=20, description="Avatar color")
-    
-    @field_validator('name')
-    @classmethod
-    def validate_name(cls, v: str) -> str:
-        if not v.strip():
-            raise ValueError("Name cannot be empty")
-        return v.strip()
 
 
-class FriendResponse(BaseModel):
+class FriendResponse(_Base):
     """Response model for friend data."""
     id: int
     name: str
@@ -410,22 +385,22 @@ class FriendResponse(BaseModel):
     avatar_color: str
     created_at: DateTimeType
     
-    class Config:
-        from_attributes = True
+    model_config = _ORM_CONFIG
 
 
-class SplitCreate(BaseModel):
+@dataclass(frozen=True, slots=True)
+class SplitCreate:
     """Request model for splitting an expense."""
     friend_id: int = Field(..., description="Friend to split with")
     amount: float = Field(..., gt=0, description="Amount this friend owes")
 
 
-class SplitExpenseRequest(BaseModel):
+class SplitExpenseRequest(_Base):
     """Request to split an expense with multiple friends."""
     splits: List[SplitCreate] = Field(..., min_length=1, description="List of splits")
 
 
-class SplitResponse(BaseModel):
+class SplitResponse(_Base):
     """Response model for expense split."""
     id: int
     expense_id: int
@@ -436,11 +411,11 @@ class SplitResponse(BaseModel):
     settled_at: Optional[DateTimeType]
     created_at: DateTimeType
     
-    class Config:
-        from_attributes = True
+    model_config = _ORM_CONFIG
 
 
-class BalanceSummary(BaseModel):
+@dataclass(frozen=True, slots=True)
+class BalanceSummary:
     """Summary of balances with a friend."""
     friend_id: int
     friend_name: str
@@ -450,7 +425,7 @@ class BalanceSummary(BaseModel):
     unsettled_count: int
 
 
-class BalancesResponse(BaseModel):
+class BalancesResponse(_Base):
     """Response with all balance summaries."""
     total_owed_to_you: float
     balances: List[BalanceSummary]
@@ -460,32 +435,22 @@ class BalancesResponse(BaseModel):
 # Subscription Models
 # ============================================================================
 
-class BillingCycle(str, Enum):
-    """Billing cycle options."""
-    WEEKLY = "weekly"
-    MONTHLY = "monthly"
-    YEARLY = "yearly"
+# Billing cycle options
+BillingCycle = Literal["weekly", "monthly", "yearly"]
 
 
-class SubscriptionCreate(BaseModel):
+class SubscriptionCreate(_Base):
     """Request model for creating a subscription."""
-    name: str = Field(..., min_length=1, max_length=100, description="Subscription name")
+    name: NonEmptyStr = Field(..., max_length=100, description="Subscription name")
     amount: float = Field(..., gt=0, description="Subscription amount")
     billing_cycle: BillingCycle = Field(..., description="Billing frequency")
     next_renewal: DateType = Field(..., description="Next renewal date")
     category: Optional[str] = Field(None, max_length=50, description="Category")
     reminder_days: int = Field(3, ge=0, le=30, description="Days before renewal to remind")
     notes: Optional[str] = Field(None, max_length=500, description="Optional notes")
-    
-    @field_validator('name')
-    @classmethod
-    def validate_name(cls, v: str) -> str:
-        if not v.strip():
-            raise ValueError("Name cannot be empty")
-        return v.strip()
 
 
-class SubscriptionUpdate(BaseModel):
+class SubscriptionUpdate(_Base):
     """Request model for updating a subscription."""
     name: Optional[str] = Field(None, min_length=1, max_length=100)
     amount: Optional[float] = Field(None, gt=0)
@@ -497,7 +462,7 @@ class SubscriptionUpdate(BaseModel):
     notes: Optional[str] = Field(None, max_length=500)
 
 
-class SubscriptionResponse(BaseModel):
+class SubscriptionResponse(_Base):
     """Response model for subscription data."""
     id: int
     name: str
@@ -515,55 +480,14 @@ class SubscriptionResponse(BaseModel):
     days_until_renewal: Optional[int] = None
     monthly_cost: float = 0.0  # Normalized to monthly
     
-    class Config:
-        from_attributes = True
-
-
-# ============================================================================
-# Rebuild models for Pydantic v2 compatibility with `from __future__ import annotations`
-# ============================================================================
-ExpenseCreate.model_rebuild()
-ExpenseResponse.model_rebuild()
-ExpenseUpdate.model_rebuild()
-CategorySuggestion.model_rebuild()
-CategoryResponse.model_rebuild()
-BudgetCreate.model_rebuild()
-BudgetResponse.model_rebuild()
-BudgetStatus.model_rebuild()
-NLQueryRequest.model_rebuild()
-NLQueryResponse.model_rebuild()
-DataSource.model_rebuild()
-InsightResponse.model_rebuild()
-AuditLogEntry.model_rebuild()
-SpendingByCategory.model_rebuild()
-SpendingTrend.model_rebuild()
-AnalyticsSummary.model_rebuild()
-SafeToSpendResponse.model_rebuild()
-GoalCreate.model_rebuild()
-GoalUpdate.model_rebuild()
-GoalResponse.model_rebuild()
-ContributionCreate.model_rebuild()
-ContributionResponse.model_rebuild()
-AlertResponse.model_rebuild()
-BudgetStatusWithAlert.model_rebuild()
-AlertsSummary.model_rebuild()
-FriendCreate.model_rebuild()
-FriendResponse.model_rebuild()
-SplitCreate.model_rebuild()
-SplitExpenseRequest.model_rebuild()
-SplitResponse.model_rebuild()
-BalanceSummary.model_rebuild()
-BalancesResponse.model_rebuild()
-SubscriptionCreate.model_rebuild()
-SubscriptionUpdate.model_rebuild()
-SubscriptionResponse.model_rebuild()
+    model_config = _ORM_CONFIG
 
 
 # ============================================================================
 # Income Models
 # ============================================================================
 
-class IncomeCreate(BaseModel):
+class IncomeCreate(_Base):
     """Request model for adding income."""
     amount: float = Field(..., gt=0, description="Income amount")
     source: str = Field(..., min_length=1, max_length=100, description="Source of income (e.g. Job)")
@@ -571,7 +495,7 @@ class IncomeCreate(BaseModel):
     date: DateType = Field(..., description="Date received")
     is_recurring: bool = Field(False, description="Is this a recurring income?")
 
-class IncomeResponse(BaseModel):
+class IncomeResponse(_Base):
     """Response model for income data."""
     id: int
     user_id: int
@@ -582,8 +506,7 @@ class IncomeResponse(BaseModel):
     is_recurring: bool
     created_at: DateTimeType
     
-    class Config:
-        from_attributes = True
+    model_config = _ORM_CONFIG
 
 
 
@@ -0,0 +1,26 @@
+"""
+Fast JSON responses for FinLens AI.
+
+List endpoints return many rows; FastAPI's default path validates them,
+runs jsonable_encoder, then json.dumps. These helpers validate and encode
+in a single pydantic-core pass straight to bytes.
+"""
+
+from typing import Any, List
+
+from fastapi import Response
+from pydantic import TypeAdapter
+
+
+def list_adapter(model: type) -> TypeAdapter:
+    """Build a reusable adapter for a list of `model` (create once at import)."""
+    return TypeAdapter(List[model])
+
+
+def json_response(adapter: TypeAdapter, data: Any, status_code: int = 200) -> Response:
+    """Validate `data` with `adapter` and return it as pre-encoded JSON."""
+    return Response(
+        content=adapter.dump_json(adapter.validate_python(data)),
+        status_code=status_code,
+        media_type="application/json",
+    )
@@ -2,34 +2,34 @@
 Alerts API routes for spending notifications.
 """
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
 from typing import List
 from datetime import datetime, date
-from calendar import monthrange
 import aiosqlite
 
 from database import get_db
-from models import AlertResponse, AlertsSummary, BudgetStatusWithAlert
-from services.alerts import get_unread_alerts, get_unread_count, mark_alert_read, dismiss_alert, mark_all_read
+from dates import month_bounds
+from models import AlertsSummary, BudgetStatusWithAlert
+from services.alerts import get_unread_with_count, mark_alert_read, dismiss_alert, mark_all_read
 from dependencies import get_current_user, require_auth
+from etags import ETagRoute, user_data_etag
+from pydantic import TypeAdapter
+from responses import list_adapter, json_response
+from services.response_cache import analytics_cache
 from typing import List, Optional
 
-router = APIRouter()
-
-
-def row_to_alert(row: aiosqlite.Row) -> AlertResponse:
-    """Convert database row to AlertResponse."""
-    return AlertResponse(
-        id=row["id"],
-        type=row["type"],
-        title=row["title"],
-        message=row["message"],
-        category=row["category"],
-        threshold_percent=row["threshold_percent"],
-        is_read=bool(row["is_read"]),
-        is_dismissed=bool(row["is_dismissed"]),
-        created_at=row["created_at"]
-    )
+router = APIRouter(route_class=ETagRoute)
+
+# Validate and encode responses in one pydantic-core pass
+_ALERTS_SUMMARY = TypeAdapter(AlertsSummary)
+_BUDGET_STATUS_LIST = list_adapter(BudgetStatusWithAlert)
+
+# Budget alert message per level; each takes over=, remaining= and days= keywords
+_ALERT_MESSAGES = {
+    "exceeded": "Over budget by GH₵{over:.2f}".format,
+    "danger": "Only GH₵{remaining:.2f} remaining".format,
+    "warning": "GH₵{remaining:.2f} left for {days} days".format,
+}
 
 
 # ============================================================================
@@ -43,17 +43,9 @@ async def list_alerts(
     user: dict = Depends(require_auth)
 ):
     """Get alerts summary with unread count for current user."""
-    alerts = await get_unread_alerts(db, user["id"], limit)
-    unread_count = await get_unread_count(db, user["id"])
+    alerts, unread_count = await get_unread_with_count(db, user["id"], limit)
     
-    return AlertsSummary(
-        unread_count=unread_count,
-        alerts=[row_to_alert(a) if isinstance(a, aiosqlite.Row) else AlertResponse(**{
-            **a,
-            "is_read": bool(a.get("is_read", 0)),
-            "is_dismissed": bool(a.get("is_dismissed", 0))
-        }) for a in alerts]
-    )
+    return json_response(_ALERTS_SUMMARY, {"unread_count": unread_count, "alerts": alerts})
 
 
 @router.patch("/{alert_id}/read")
@@ -96,71 +88,91 @@ async def mark_all_alerts_read(
 # Budget Status with Alerts
 # ============================================================================
 
-@router.get("/budget-status", response_model=List[BudgetStatusWithAlert])
+# Budget status SQL is built once so every call sends identical text, which
+# lets asyncpg's per-connection statement cache reuse the prepared plan
+_BUDGET_STATUS_SQL = """
+WITH spending AS (
+    SELECT
+        b.category,
+        b.monthly_limit,
+        COALESCE(SUM(e.amount), 0) as spent
+    FROM budgets b
+    LEFT JOIN expenses e ON e.category = b.category
+        AND e.date >= ? AND e.date <= ? AND e.user_id = ?
+    WHERE b.user_id = ?
+    GROUP BY b.category, b.monthly_limit
+)
+SELECT
+    category,
+    monthly_limit::float8 as monthly_limit,
+    spent::float8 as spent,
+    GREATEST(monthly_limit - spent, 0)::float8 as remaining,
+    CASE WHEN monthly_limit > 0 THEN spent / monthly_limit * 100 ELSE 0 END as percentage_used,
+    GREATEST(monthly_limit - spent, 0) / ? as daily_allowance,
+    CASE
+        WHEN monthly_limit <= 0 THEN 'safe'
+        WHEN spent >= monthly_limit THEN 'exceeded'
+        WHEN spent >= 0.8 * monthly_limit THEN 'danger'
+        WHEN spent >= 0.5 * monthly_limit THEN 'warning'
+        ELSE 'safe'
+    END as alert_level
+FROM spending
+ORDER BY category
+"""
+
+
+@router.get(
+    "/budget-status",
+    response_model=List[BudgetStatusWithAlert],
+    dependencies=[Depends(user_data_etag)]
+)
 async def get_budget_status_with_alerts(
+    request: Request,
     db: aiosqlite.Connection = Depends(get_db),
     user: dict = Depends(require_auth)
 ):
     """Get all budget statuses with alert levels for current user."""
     # Get current month boundaries
     today = date.today()
-    month_start = date(today.year, today.month, 1)
-    days_in_month = monthrange(today.year, today.month)[1]
-    month_end = date(today.year, today.month, days_in_month)
+    month_start, month_end, _ = month_bounds(today.year, today.month)
     days_remaining = max(1, (month_end - today).days + 1)
     
-    # Get all budgets with current spending
-    cursor = await db.execute(
-        """
-        SELECT 
-            b.category,
-            b.monthly_limit,
-            COALESCE(SUM(e.amount), 0) as spent
-        FROM budgets b
-        LEFT JOIN expenses e ON e.category = b.category 
-            AND e.date >= ? AND e.date <= ? AND e.user_id = ?
-        WHERE b.user_id = ?
-        GROUP BY b.category, b.monthly_limit
-        ORDER BY b.category
-        """,
-        (month_start, month_end, user["id"], user["id"])
+    # user_data_etag has already answered 304 for a matching If-None-Match;
+    # a body cached under the same tag is still current
+    cached = analytics_cache.get(user["id"], request.state.etag)
+    if cached is not None:
+        return Response(content=cached, media_type="application/json")
+    
+    # Get all budgets with current spending; every field and the alert level are
+    # computed in SQL. Ratios stay NUMERIC so round() keeps its half-even ties
+    rows = await db.execute_fetchall(
+        _BUDGET_STATUS_SQL,
+        (month_start, month_end, user["id"], user["id"], days_remaining)
     )
-    rows = await cursor.fetchall()
     
     results = []
     for row in rows:
-        category = row["category"]
-        monthly_limit = row["monthly_limit"]
-        spent = row["spent"]
-        remaining = max(0, monthly_limit - spent)
-        percentage = (spent / monthly_limit * 100) if monthly_limit > 0 else 0
-        daily_allowance = remaining / days_remaining if days_remaining > 0 else 0
+        alert_level = row["alert_level"]
+        format_message = _ALERT_MESSAGES.get(alert_level)
+        alert_message = format_message(
+            over=row["spent"] - row["monthly_limit"],
+            remaining=row["remaining"],
+            days=days_remaining
+        ) if format_message else None
         
-        # Determine alert level
-        if percentage >= 100:
-            alert_level = "exceeded"
-            alert_message = f"Over budget by GH₵{spent - monthly_limit:.2f}"
-        elif percentage >= 80:
-            alert_level = "danger"
-            alert_message = f"Only GH₵{remaining:.2f} remaining"
-        elif percentage >= 50:
-            alert_level = "warning"
-            alert_message = f"GH₵{remaining:.2f} left for {days_remaining} days"
-        else:
-            alert_level = "safe"
-            alert_message = None
-        
-        results.append(BudgetStatusWithAlert(
-            category=category,
-            monthly_limit=monthly_limit,
-            current_spending=spent,
-            remaining=remaining,
-            percentage_used=round(percentage, 1),
-            is_over_budget=percentage >= 100,
-            daily_allowance=round(daily_allowance, 2),
+        # Values come straight from SQL, so skip validation
+        results.append(BudgetStatusWithAlert.model_construct(
+            category=row["category"],
+            monthly_limit=row["monthly_limit"],
+            current_spending=row["spent"],
+            remaining=row["remaining"],
+            percentage_used=float(round(row["percentage_used"], 1)),
+            is_over_budget=alert_level == "exceeded",
+            daily_allowance=float(round(row["daily_allowance"], 2)),
             alert_level=alert_level,
             alert_message=alert_message
         ))
     
-    return results
-
+    content = _BUDGET_STATUS_LIST.dump_json(results)
+    analytics_cache.set(user["id"], request.state.etag, content)
+    return Response(content=content, media_type="application/json")
@@ -3,13 +3,14 @@ Analytics routes for FinLens AI.
 Provides spending analysis and aggregations.
 """
 
-from fastapi import APIRouter, Depends, Query, Header
+from fastapi import APIRouter, Depends, Query, Header, Request, Response
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from typing import List, Optional
-from datetime import date, datetime, timedelta
+from datetime import date, timedelta
 import aiosqlite
 
 from database import get_db
+from dates import month_bounds
 from models import (
     SpendingByCategory,
     SpendingTrend,
@@ -18,20 +19,57 @@ from models import (
     SafeToSpendResponse,
 )
 from dependencies import require_auth
+from etags import ETagRoute, user_data_etag
+from pydantic import TypeAdapter
+from pydantic_core import to_json
+from responses import list_adapter
+from services.response_cache import analytics_cache
 
-router = APIRouter()
+router = APIRouter(route_class=ETagRoute, dependencies=[Depends(user_data_etag)])
 security = HTTPBearer(auto_error=False)
 
+_ANALYTICS_SUMMARY = TypeAdapter(AnalyticsSummary)
+_BUDGET_STATUS_LIST = list_adapter(BudgetStatus)
+_SAFE_TO_SPEND = TypeAdapter(SafeToSpendResponse)
 
-def build_user_filter(user: Optional[dict]) -> tuple[str, list]:
-    """Build SQL filter for user-specific data."""
-    if user:
-        return "user_id = ?", [user["id"]]
-    return "1=1", []
+
+def _cached_response(request: Request, user_id: int) -> Optional[Response]:
+    """Return the cached JSON body for this request's ETag, if still fresh."""
+    content = analytics_cache.get(user_id, request.state.etag)
+    if content is None:
+        return None
+    return Response(content=content, media_type="application/json")
+
+
+def _store_response(request: Request, user_id: int, content: bytes) -> Response:
+    """
+    Cache a serialized JSON body under this request's ETag.
+    The tag was computed before the body's queries ran, so a write that lands
+    in between only makes the body newer than its tag, never older.
+    """
+    analytics_cache.set(user_id, request.state.etag, content)
+    return Response(content=content, media_type="application/json")
+
+
+_SUMMARY_SQL = """
+WITH per_category AS (
+    SELECT category, SUM(amount) as total, COUNT(*) as count
+    FROM expenses
+    WHERE date >= ? AND date <= ? AND user_id = ?
+    GROUP BY category
+)
+SELECT
+    COALESCE(SUM(total), 0) as total,
+    COALESCE(SUM(count), 0)::bigint as count,
+    (SELECT category FROM per_category ORDER BY total DESC LIMIT 1) as top_category,
+    (SELECT MAX(total) FROM per_category) as top_category_amount
+FROM per_category
+"""
 
 
 @router.get("/summary", response_model=AnalyticsSummary)
 async def get_analytics_summary(
+    request: Request,
     start_date: Optional[date] = None,
     end_date: Optional[date] = None,
     db: aiosqlite.Connection = Depends(get_db),
@@ -43,44 +81,24 @@ async def get_analytics_summary(
     if not start_date:
         start_date = end_date - timedelta(days=30)
     
-    user_filter, user_params = build_user_filter(user)
-    
-    cursor = await db.execute(
-        f"""
-        SELECT 
-            COALESCE(SUM(amount), 0) as total,
-            COUNT(*) as count
-        FROM expenses
-        WHERE date >= ? AND date <= ? AND {user_filter}
-        """,
-        (start_date, end_date, *user_params)
-    )
-    row = await cursor.fetchone()
+    cached = _cached_response(request, user["id"])
+    if cached is not None:
+        return cached
+    
+    # Totals and the top category come from one scan grouped by category
+    row = await db.execute_fetchone(_SUMMARY_SQL, (start_date, end_date, user["id"]))
     total_expenses = row["total"]
     expense_count = row["count"]
     average_expense = total_expenses / expense_count if expense_count > 0 else 0
     
-    cursor = await db.execute(
-        f"""
-        SELECT category, SUM(amount) as total
-        FROM expenses
-        WHERE date >= ? AND date <= ? AND {user_filter}
-        GROUP BY category
-        ORDER BY total DESC
-        LIMIT 1
-        """,
-        (start_date, end_date, *user_params)
-    )
-    top_row = await cursor.fetchone()
-    
-    if top_row:
-        top_category = top_row["category"]
-        top_category_amount = top_row["total"]
+    if row["top_category"] is not None:
+        top_category = row["top_category"]
+        top_category_amount = row["top_category_amount"]
     else:
         top_category = "None"
         top_category_amount = 0
     
-    return AnalyticsSummary(
+    summary = AnalyticsSummary(
         total_expenses=total_expenses,
         expense_count=expense_count,
         average_expense=average_expense,
@@ -89,10 +107,25 @@ async def get_analytics_summary(
         date_range_start=start_date,
         date_range_end=end_date
     )
+    return _store_response(request, user["id"], _ANALYTICS_SUMMARY.dump_json(summary))
+
+
+_BY_CATEGORY_SQL = """
+SELECT
+    category,
+    SUM(amount)::float8 as total,
+    COUNT(*) as count,
+    COALESCE(SUM(amount) / NULLIF(SUM(SUM(amount)) OVER (), 0) * 100, 0)::float8 as percentage
+FROM expenses
+WHERE date >= ? AND date <= ? AND user_id = ?
+GROUP BY category
+ORDER BY total DESC
+"""
 
 
 @router.get("/by-category", response_model=List[SpendingByCategory])
 async def get_spending_by_category(
+    request: Request,
     start_date: Optional[date] = None,
     end_date: Optional[date] = None,
     db: aiosqlite.Connection = Depends(get_db),
@@ -104,49 +137,34 @@ async def get_spending_by_category(
     if not start_date:
         start_date = end_date - timedelta(days=30)
     
-    user_filter, user_params = build_user_filter(user)
+    cached = _cached_response(request, user["id"])
+    if cached is not None:
+        return cached
     
-    cursor = await db.execute(
-        f"""
-        SELECT COALESCE(SUM(amount), 0) as total
-        FROM expenses
-        WHERE date >= ? AND date <= ? AND {user_filter}
-        """,
-        (start_date, end_date, *user_params)
-    )
-    total_row = await cursor.fetchone()
-    grand_total = total_row["total"]
-    
-    cursor = await db.execute(
-        f"""
-        SELECT 
-            category,
-            SUM(amount) as total,
-            COUNT(*) as count
-        FROM expenses
-        WHERE date >= ? AND date <= ? AND {user_filter}
-        GROUP BY category
-        ORDER BY total DESC
-        """,
-        (start_date, end_date, *user_params)
+    # Each category's share of the range total comes from a window over the grouped sums
+    rows = await db.execute_fetchall(
+        _BY_CATEGORY_SQL,
+        (start_date, end_date, user["id"])
     )
-    rows = await cursor.fetchall()
     
-    results = []
-    for row in rows:
-        percentage = (row["total"] / grand_total * 100) if grand_total > 0 else 0
-        results.append(SpendingByCategory(
-            category=row["category"],
-            total=row["total"],
-            count=row["count"],
-            percentage=percentage
-        ))
-    
-    return results
+    # Rows already match SpendingByCategory; response_model only documents the shape
+    return _store_response(request, user["id"], to_json([dict(row) for row in rows]))
+
+
+_TRENDS_SQL = """
+SELECT
+    to_char(date, 'YYYY-MM-DD') as date,
+    SUM(amount)::float8 as total
+FROM expenses
+WHERE date >= ? AND date <= ? AND user_id = ?
+GROUP BY date
+ORDER BY date ASC
+"""
 
 
 @router.get("/trends", response_model=List[SpendingTrend])
 async def get_spending_trends(
+    request: Request,
     start_date: Optional[date] = None,
     end_date: Optional[date] = None,
     db: aiosqlite.Connection = Depends(get_db),
@@ -158,30 +176,33 @@ async def get_spending_trends(
     if not start_date:
         start_date = end_date - timedelta(days=30)
     
-    user_filter, user_params = build_user_filter(user)
-    
-    cursor = await db.execute(
-        f"""
-        SELECT 
-            date,
-            SUM(amount) as total
-        FROM expenses
-        WHERE date >= ? AND date <= ? AND {user_filter}
-        GROUP BY date
-        ORDER BY date ASC
-        """,
-        (start_date, end_date, *user_params)
+    cached = _cached_response(request, user["id"])
+    if cached is not None:
+        return cached
+    
+    # Rows arrive already JSON-shaped (ISO date strings, float totals)
+    rows = await db.execute_fetchall(
+        _TRENDS_SQL,
+        (start_date, end_date, user["id"])
     )
-    rows = await cursor.fetchall()
     
-    return [
-        SpendingTrend(date=row["date"], total=row["total"])
-        for row in rows
-    ]
+    return _store_response(request, user["id"], to_json([dict(row) for row in rows]))
+
+
+_HEATMAP_SQL = """
+SELECT
+    to_char(date, 'YYYY-MM-DD') as day,
+    SUM(amount)::float8 as total
+FROM expenses
+WHERE date >= ? AND date <= ? AND user_id = ?
+GROUP BY date
+ORDER BY date ASC
+"""
 
 
 @router.get("/heatmap")
 async def get_spending_heatmap(
+    request: Request,
     year: int = Query(default=None),
     month: int = Query(default=None),
     db: aiosqlite.Connection = Depends(get_db),
@@ -193,89 +214,87 @@ async def get_spending_heatmap(
         year = today.year
         month = today.month
     
-    start_date = date(year, month, 1)
-    if month == 12:
-        end_date = date(year + 1, 1, 1) - timedelta(days=1)
-    else:
-        end_date = date(year, month + 1, 1) - timedelta(days=1)
-    
-    user_filter, user_params = build_user_filter(user)
-    
-    cursor = await db.execute(
-        f"""
-        SELECT 
-            date,
-            SUM(amount) as total
-        FROM expenses
-        WHERE date >= ? AND date <= ? AND {user_filter}
-        GROUP BY date
-        ORDER BY date ASC
-        """,
-        (start_date, end_date, *user_params)
-    )
-    rows = await cursor.fetchall()
+    start_date, end_date, _ = month_bounds(year, month)
     
-    heatmap_data = {}
-    for row in rows:
-        heatmap_data[str(row["date"])] = row["total"]
+    cached = _cached_response(request, user["id"])
+    if cached is not None:
+        return cached
     
-    return {
+    # Day keys and float totals come straight from SQL
+    rows = await db.execute_fetchall(
+        _HEATMAP_SQL,
+        (start_date, end_date, user["id"])
+    )
+    
+    return _store_response(request, user["id"], to_json({
         "year": year,
         "month": month,
-        "data": heatmap_data
-    }
+        "data": {row["day"]: row["total"] for row in rows}
+    }))
+
+
+# Month spending per budget, shared by /budget-status and /safe-to-spend
+_BUDGET_SPENDING_CTE = """
+budget_spending AS (
+    SELECT
+        b.category,
+        b.monthly_limit,
+        COALESCE(SUM(e.amount), 0) as spent
+    FROM budgets b
+    LEFT JOIN expenses e ON b.category = e.category
+        AND e.date >= ? AND e.date <= ? AND e.user_id = ?
+    WHERE b.user_id = ?
+    GROUP BY b.category, b.monthly_limit
+)
+"""
+
+_BUDGET_STATUS_SQL = "WITH" + _BUDGET_SPENDING_CTE + """SELECT
+    category,
+    monthly_limit,
+    spent as current_spending,
+    monthly_limit - spent as remaining,
+    spent > monthly_limit as is_over_budget
+FROM budget_spending
+"""
 
 
 @router.get("/budget-status", response_model=List[BudgetStatus])
 async def get_budget_status(
+    request: Request,
     month: Optional[int] = None,
     year: Optional[int] = None,
     db: aiosqlite.Connection = Depends(get_db),
     user: dict = Depends(require_auth)
 ):
     """Get budget status for all categories."""
+    today = date.today()
     if not year or not month:
-        today = date.today()
         year = today.year
         month = today.month
     
-    start_date = date(year, month, 1)
-    if month == 12:
-        end_date = date(year + 1, 1, 1) - timedelta(days=1)
-    else:
-        end_date = date(year, month + 1, 1) - timedelta(days=1)
+    start_date, end_date, _ = month_bounds(year, month)
     
-    today = date.today()
     if today.year == year and today.month == month:
         days_remaining = (end_date - today).days + 1
     else:
         days_remaining = 0
     
-    user_filter, user_params = build_user_filter(user)
-    
-    cursor = await db.execute(
-        f"""
-        SELECT 
-            b.category,
-            b.monthly_limit,
-            COALESCE(SUM(e.amount), 0) as current_spending
-        FROM budgets b
-        LEFT JOIN expenses e ON b.category = e.category 
-            AND e.date >= ? AND e.date <= ? AND e.user_id = ?
-        WHERE b.user_id = ?
-        GROUP BY b.category, b.monthly_limit
-        """,
+    cached = _cached_response(request, user["id"])
+    if cached is not None:
+        return cached
+    
+    rows = await db.execute_fetchall(
+        _BUDGET_STATUS_SQL,
         (start_date, end_date, user["id"], user["id"])
     )
-    rows = await cursor.fetchall()
     
+    # Ratios stay in Python so they keep full DECIMAL precision
     results = []
     for row in rows:
         monthly_limit = row["monthly_limit"]
         current_spending = row["current_spending"]
-        remaining = monthly_limit - current_spending
+        remaining = row["remaining"]
         percentage_used = (current_spending / monthly_limit * 100) if monthly_limit > 0 else 0
-        is_over_budget = current_spending > monthly_limit
         daily_allowance = (remaining / days_remaining) if days_remaining > 0 else 0
         
         results.append(BudgetStatus(
@@ -284,15 +303,54 @@ async def get_budget_status(
             current_spending=current_spending,
             remaining=remaining,
             percentage_used=percentage_used,
-            is_over_budget=is_over_budget,
+            is_over_budget=row["is_over_budget"],
             daily_allowance=daily_allowance
         ))
     
-    return results
+    return _store_response(request, user["id"], _BUDGET_STATUS_LIST.dump_json(results))
+
+
+_SAFE_TO_SPEND_SQL = """
+WITH month_income AS (
+    SELECT COALESCE(SUM(amount), 0) as total_income
+    FROM incomes
+    WHERE user_id = ? AND date >= ? AND date <= ?
+),
+month_expenses AS (
+    SELECT
+        COALESCE(SUM(amount), 0) as spent_this_month,
+        COALESCE(SUM(amount) FILTER (WHERE date = ?), 0) as spent_today
+    FROM expenses
+    WHERE date >= ? AND date <= ? AND user_id = ?
+),
+goal_reserves AS (
+    SELECT COALESCE(SUM(
+        (target_amount - current_amount) / GREATEST(
+            (EXTRACT(YEAR FROM target_date) - ?) * 12 + (EXTRACT(MONTH FROM target_date) - ?), 1
+        )
+    ), 0) as goals_reserved
+    FROM savings_goals
+    WHERE user_id = ? AND is_completed = 0 AND target_date IS NOT NULL
+        AND target_amount > current_amount
+),""" + _BUDGET_SPENDING_CTE + """SELECT
+    total_income, spent_this_month, spent_today, goals_reserved,
+    budget_spending.category, budget_spending.monthly_limit, budget_spending.spent,
+    CASE
+        WHEN budget_spending.spent > budget_spending.monthly_limit THEN 'exceeded'
+        WHEN budget_spending.monthly_limit > 0
+            AND budget_spending.spent * 100 >= 80 * budget_spending.monthly_limit THEN 'warning'
+        ELSE 'safe'
+    END as status
+FROM month_income
+CROSS JOIN month_expenses
+CROSS JOIN goal_reserves
+LEFT JOIN budget_spending ON TRUE
+"""
 
 
 @router.get("/safe-to-spend", response_model=SafeToSpendResponse)
 async def get_safe_to_spend(
+    request: Request,
     db: aiosqlite.Connection = Depends(get_db),
     user: dict = Depends(require_auth)
 ):
@@ -309,93 +367,35 @@ async def get_safe_to_spend(
     month = today.month
     
     # Calculate date range for current month
-    start_date = date(year, month, 1)
-    if month == 12:
-        end_date = date(year + 1, 1, 1) - timedelta(days=1)
-    else:
-        end_date = date(year, month + 1, 1) - timedelta(days=1)
+    start_date, end_date, _ = month_bounds(year, month)
     
     days_remaining = max((end_date - today).days + 1, 1)  # At least 1 day
     
-    user_filter, user_params = build_user_filter(user)
-    
-    # Get total monthly income (instead of budgets)
-    cursor = await db.execute(
-        """
-        SELECT COALESCE(SUM(amount), 0) as total 
-        FROM incomes 
-        WHERE user_id = ? AND date >= ? AND date <= ?
-        """, 
-        (user["id"], start_date, end_date)
-    )
-    row = await cursor.fetchone()
-    total_income = float(row["total"]) if row else 0.0
-    
-    # Get total spent this month
-    cursor = await db.execute(
-        f"""
-        SELECT COALESCE(SUM(amount), 0) as total
-        FROM expenses
-        WHERE date >= ? AND date <= ? AND {user_filter}
-        """,
-        (start_date, end_date, *user_params)
-    )
-    row = await cursor.fetchone()
-    spent_this_month = float(row["total"]) if row else 0.0
-    
-    # Get goals that need contributions this month (active goals with target dates)
-    # Calculate monthly contribution needed: (target - current) / months until target
-    cursor = await db.execute(
-        """
-        SELECT 
-            target_amount,
-            current_amount,
-            target_date
-        FROM savings_goals
-        WHERE user_id = ? AND is_completed = 0 AND target_date IS NOT NULL
-        """,
-        (user["id"],)
+    cached = _cached_response(request, user["id"])
+    if cached is not None:
+        return cached
+    
+    # Monthly income (instead of budgets), spending, and the monthly contribution still
+    # needed by active goals: (target - current) / whole months until target, at least 1.
+    # The totals repeat on every budget row; a user without budgets gets a single
+    # row whose budget columns are NULL
+    rows = await db.execute_fetchall(
+        _SAFE_TO_SPEND_SQL,
+        (
+            user["id"], start_date, end_date,
+            today, start_date, end_date, user["id"],
+            year, month, user["id"],
+            start_date, end_date, user["id"], user["id"]
+        )
     )
-    goals_rows = await cursor.fetchall()
-    
-    goals_reserved = 0.0
-    for goal in goals_rows:
-        target = float(goal["target_amount"])
-        current = float(goal["current_amount"])
-        remaining_to_save = target - current
-        
-        if remaining_to_save > 0 and goal["target_date"]:
-            # Convert target_date to date object if it's a string
-            target_date = goal["target_date"]
-            if isinstance(target_date, str):
-                target_date = datetime.strptime(target_date, "%Y-%m-%d").date()
-            
-            # Calculate months until target
-            months_until = ((target_date.year - today.year) * 12 + 
-                           (target_date.month - today.month))
-            months_until = max(months_until, 1)
-            
-            # Monthly contribution needed
-            monthly_contribution = remaining_to_save / months_until
-            goals_reserved += monthly_contribution
+    row = rows[0]
+    total_income = float(row["total_income"])
+    spent_this_month = float(row["spent_this_month"])
+    spent_today = float(row["spent_today"])
+    goals_reserved = float(row["goals_reserved"])
     
     # === NEW: Budget tracking per category ===
-    # Get all budgets with their spending for this month
-    cursor = await db.execute(
-        """
-        SELECT 
-            b.category,
-            b.monthly_limit,
-            COALESCE(SUM(e.amount), 0) as spent
-        FROM budgets b
-        LEFT JOIN expenses e ON b.category = e.category 
-            AND e.date >= ? AND e.date <= ? AND e.user_id = ?
-        WHERE b.user_id = ?
-        GROUP BY b.category, b.monthly_limit
-        """,
-        (start_date, end_date, user["id"], user["id"])
-    )
-    budget_rows = await cursor.fetchall()
+    budget_rows = [row for row in rows if row["category"] is not None]
     
     categories_over_budget = []
     categories_near_limit = []
@@ -403,20 +403,18 @@ async def get_safe_to_spend(
     
     for row in budget_rows:
         limit = float(row["monthly_limit"])
+        total_budget_limit += limit
+        
+        # Status is classified in SQL on the exact DECIMAL values; only
+        # exceeded and warning budgets are reported, so skip the rest early
+        status = row["status"]
+        if status == "safe":
+            continue
+        
         spent = float(row["spent"])
         remaining = limit - spent
         percentage_used = (spent / limit * 100) if limit > 0 else 0
         
-        total_budget_limit += limit
-        
-        # Determine status
-        if spent > limit:
-            status = "exceeded"
-        elif percentage_used >= 80:
-            status = "warning"
-        else:
-            status = "safe"
-        
         category_status = CategoryBudgetStatus(
             category=row["category"],
             limit=round(limit, 2),
@@ -428,7 +426,7 @@ async def get_safe_to_spend(
         
         if status == "exceeded":
             categories_over_budget.append(category_status)
-        elif status == "warning":
+        else:
             categories_near_limit.append(category_status)
     
     has_budget_warnings = len(categories_over_budget) > 0 or len(categories_near_limit) > 0
@@ -439,18 +437,6 @@ async def get_safe_to_spend(
     remaining_income = total_income - spent_this_month
     safe_to_spend_today = max(remaining_income / days_remaining, 0)
     
-    # Get today's spending
-    cursor = await db.execute(
-        f"""
-        SELECT COALESCE(SUM(amount), 0) as total
-        FROM expenses
-        WHERE date = ? AND {user_filter}
-        """,
-        (today, *user_params)
-    )
-    row = await cursor.fetchone()
-    spent_today = float(row["total"]) if row else 0.0
-    
     # Calculate if over daily limit
     over_daily_limit = spent_today > safe_to_spend_today
     daily_overspend_amount = max(spent_today - safe_to_spend_today, 0)
@@ -464,12 +450,12 @@ async def get_safe_to_spend(
         status = "danger"
     elif over_daily_limit:
         status = "caution"
-    elif len(categories_near_limit) > 0 or (spent_this_month / total_income * 100) > 80 if total_income > 0 else False:
+    elif categories_near_limit or (total_income > 0 and spent_this_month * 100 > total_income * 80):
         status = "caution"
     else:
         status = "healthy"
     
-    return SafeToSpendResponse(
+    response = SafeToSpendResponse(
         safe_to_spend_today=round(safe_to_spend_today, 2),
         total_budget=round(total_income, 2),  # Renamed field still returns income
         spent_this_month=round(spent_this_month, 2),
@@ -485,11 +471,26 @@ async def get_safe_to_spend(
         total_budget_limit=round(total_budget_limit, 2),
         has_budget_warnings=has_budget_warnings
     )
+    
+    return _store_response(request, user["id"], _SAFE_TO_SPEND.dump_json(response))
 
 
 
+_WEEKLY_SUMMARY_SQL = """
+SELECT
+    CASE WHEN date >= ? THEN 1 ELSE 0 END as is_this_week,
+    category,
+    SUM(amount) as total,
+    COUNT(*) as count
+FROM expenses
+WHERE date >= ? AND date <= ? AND user_id = ?
+GROUP BY 1, category
+"""
+
+
 @router.get("/weekly-summary")
 async def get_weekly_summary(
+    request: Request,
     db: aiosqlite.Connection = Depends(get_db),
     user: dict = Depends(require_auth)
 ):
@@ -504,52 +505,25 @@ async def get_weekly_summary(
     this_week_start = today - timedelta(days=days_since_monday)
     this_week_end = today
     
-    # Calculate last week's date range
+    # Last week runs from last_week_start up to the day before this_week_start
     last_week_start = this_week_start - timedelta(days=7)
-    last_week_end = this_week_start - timedelta(days=1)
-    
-    user_filter, user_params = build_user_filter(user)
-    
-    # Get this week's spending
-    cursor = await db.execute(
-        f"""
-        SELECT 
-            COALESCE(SUM(amount), 0) as total,
-            COUNT(*) as count
-        FROM expenses
-        WHERE date >= ? AND date <= ? AND {user_filter}
-        """,
-        (this_week_start, this_week_end, *user_params)
-    )
-    this_week = await cursor.fetchone()
-    this_week_total = float(this_week["total"]) if this_week else 0.0
-    this_week_count = this_week["count"] if this_week else 0
-    
-    # Get last week's spending
-    cursor = await db.execute(
-        f"""
-        SELECT COALESCE(SUM(amount), 0) as total
-        FROM expenses
-        WHERE date >= ? AND date <= ? AND {user_filter}
-        """,
-        (last_week_start, last_week_end, *user_params)
-    )
-    last_week = await cursor.fetchone()
-    last_week_total = float(last_week["total"]) if last_week else 0.0
-    
-    # Get top category this week
-    cursor = await db.execute(
-        f"""
-        SELECT category, SUM(amount) as total
-        FROM expenses
-        WHERE date >= ? AND date <= ? AND {user_filter}
-        GROUP BY category
-        ORDER BY total DESC
-        LIMIT 1
-        """,
-        (this_week_start, this_week_end, *user_params)
+    
+    cached = _cached_response(request, user["id"])
+    if cached is not None:
+        return cached
+    
+    # One scan over both weeks, bucketed by week and category
+    rows = await db.execute_fetchall(
+        _WEEKLY_SUMMARY_SQL,
+        (this_week_start, last_week_start, this_week_end, user["id"])
     )
-    top_cat = await cursor.fetchone()
+    
+    this_week_rows = [row for row in rows if row["is_this_week"]]
+    this_week_total = float(sum(row["total"] for row in this_week_rows))
+    this_week_count = sum(row["count"] for row in this_week_rows)
+    last_week_total = float(sum(row["total"] for row in rows if not row["is_this_week"]))
+    
+    top_cat = max(this_week_rows, key=lambda row: row["total"], default=None)
     top_category = top_cat["category"] if top_cat else None
     top_category_amount = float(top_cat["total"]) if top_cat else 0.0
     
@@ -559,7 +533,7 @@ async def get_weekly_summary(
     else:
         change_percent = 100 if this_week_total > 0 else 0
     
-    return {
+    return _store_response(request, user["id"], to_json({
         "this_week_total": round(this_week_total, 2),
         "this_week_count": this_week_count,
         "last_week_total": round(last_week_total, 2),
@@ -569,6 +543,6 @@ async def get_weekly_summary(
         "week_start": str(this_week_start),
         "week_end": str(this_week_end),
         "days_into_week": days_since_monday + 1
-    }
+    }))
 
 
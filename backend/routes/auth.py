@@ -3,19 +3,25 @@ Authentication routes for user signup, login, and token management.
 """
 
 from fastapi import APIRouter, Depends, HTTPException, status
-from pydantic import BaseModel, Field, field_validator
-from typing import Optional
+from pydantic import BaseModel, Field, TypeAdapter, field_validator
+from typing import List, Optional
 import aiosqlite
 
 from database import get_db
 from dependencies import require_auth
+from models import BudgetResponse, CategoryResponse
+from responses import json_response
+from services.budgets import fetch_budgets
+from services.categories import get_categories
 from services.auth import (
     create_user,
     authenticate_user,
     create_access_token,
     decode_token,
     get_user_by_id,
-    get_user_by_email
+    get_user_by_email,
+    invalidate_user,
+    normalize_email
 )
 
 router = APIRouter()
@@ -36,7 +42,7 @@ class UserSignup(BaseModel):
     def validate_email(cls, v: str) -> str:
         if '@' not in v or '.' not in v:
             raise ValueError("Invalid email format")
-        return v.lower().strip()
+        return normalize_email(v)
     
     @field_validator('name')
     @classmethod
@@ -50,6 +56,11 @@ class UserLogin(BaseModel):
     """User login request."""
     email: str
     password: str
+    
+    @field_validator('email')
+    @classmethod
+    def validate_email(cls, v: str) -> str:
+        return normalize_email(v)
 
 
 class TokenResponse(BaseModel):
@@ -68,7 +79,17 @@ class UserResponse(BaseModel):
     created_at: str
 
 
+class BootstrapResponse(BaseModel):
+    """Everything the app needs on first load."""
+    user: UserResponse
+    budgets: List[BudgetResponse]
+    categories: List[CategoryResponse]
+
 
+# Validate and encode auth responses in one pydantic-core pass
+_TOKEN_RESPONSE = TypeAdapter(TokenResponse)
+_USER_RESPONSE = TypeAdapter(UserResponse)
+_BOOTSTRAP_RESPONSE = TypeAdapter(BootstrapResponse)
 
 
 # ============================================================================
@@ -104,14 +125,14 @@ async def signup(
     # Generate token
     access_token = create_access_token({"sub": str(user["id"])})
     
-    return TokenResponse(
-        access_token=access_token,
-        user={
+    return json_response(_TOKEN_RESPONSE, {
+        "access_token": access_token,
+        "user": {
             "id": user["id"],
             "email": user["email"],
             "name": user["name"]
         }
-    )
+    }, status_code=status.HTTP_201_CREATED)
 
 
 @router.post("/login", response_model=TokenResponse)
@@ -120,7 +141,7 @@ async def login(
     db: aiosqlite.Connection = Depends(get_db)
 ):
     """Login with email and password."""
-    user = await authenticate_user(db, data.email.lower().strip(), data.password)
+    user = await authenticate_user(db, data.email, data.password)
     
     if not user:
         raise HTTPException(
@@ -131,26 +152,45 @@ async def login(
     # Generate token
     access_token = create_access_token({"sub": str(user["id"])})
     
-    return TokenResponse(
-        access_token=access_token,
-        user={
+    return json_response(_TOKEN_RESPONSE, {
+        "access_token": access_token,
+        "user": {
             "id": user["id"],
             "email": user["email"],
             "name": user["name"]
         }
-    )
+    })
 
 
 @router.get("/me", response_model=UserResponse)
 async def get_me(user: dict = Depends(require_auth)):
     """Get current user profile."""
-    return UserResponse(
-        id=user["id"],
-        email=user["email"],
-        name=user["name"],
-        is_active=bool(user["is_active"]),
-        created_at=str(user["created_at"])
-    )
+    return json_response(_USER_RESPONSE, {
+        "id": user["id"],
+        "email": user["email"],
+        "name": user["name"],
+        "is_active": bool(user["is_active"]),
+        "created_at": str(user["created_at"])
+    })
+
+
+@router.get("/bootstrap", response_model=BootstrapResponse)
+async def bootstrap(
+    user: dict = Depends(require_auth),
+    db: aiosqlite.Connection = Depends(get_db)
+):
+    """Get the current user, their budgets and all categories in one request."""
+    return json_response(_BOOTSTRAP_RESPONSE, {
+        "user": {
+            "id": user["id"],
+            "email": user["email"],
+            "name": user["name"],
+            "is_active": bool(user["is_active"]),
+            "created_at": str(user["created_at"])
+        },
+        "budgets": await fetch_budgets(db, user["id"]),
+        "categories": await get_categories()
+    })
 
 
 @router.get("/verify")
@@ -175,6 +215,7 @@ async def delete_account(
     # Delete the user - CASCADE will handle all related data
     await db.execute("DELETE FROM users WHERE id = ?", (user_id,))
     await db.commit()
+    invalidate_user(user_id)
     
     # Return 204 No Content on success
     return None
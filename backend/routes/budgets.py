@@ -8,11 +8,17 @@ from typing import List
 import aiosqlite
 
 from database import get_db
+from logger import get_logger
 from models import BudgetCreate, BudgetResponse
 from dependencies import require_auth
+from responses import list_adapter, json_response
+from services.budgets import fetch_budgets
 from typing import List, Optional
 
 router = APIRouter()
+logger = get_logger("budgets")
+
+_BUDGET_LIST = list_adapter(BudgetResponse)
 
 
 @router.post("/", response_model=BudgetResponse, status_code=status.HTTP_201_CREATED)
@@ -22,100 +28,29 @@ async def create_budget(
     user: dict = Depends(require_auth)
 ):
     """Create or update a budget for a category for the current user."""
-    import traceback
-    import os
-    is_postgres = 'DATABASE_URL' in os.environ and 'postgres' in os.environ.get('DATABASE_URL', '')
-    
     try:
-        print(f"[BUDGET] Starting budget creation: category={budget.category}, limit={budget.monthly_limit}, user_id={user.get('id')}, postgres={is_postgres}")
-        
-        if is_postgres:
-            # PostgreSQL: Check if exists first, then INSERT or UPDATE
-            # (ON CONFLICT has issues with RETURNING in our wrapper)
-            check_cursor = await db.execute(
-                "SELECT id FROM budgets WHERE category = ? AND user_id = ?",
-                (budget.category, user["id"])
-            )
-            existing = await check_cursor.fetchone()
-            print(f"[BUDGET] Postgres - existing check: {'found' if existing else 'not found'}")
-            
-            if existing:
-                # Update existing
-                await db.execute(
-                    """
-                    UPDATE budgets 
-                    SET monthly_limit = ?, updated_at = CURRENT_TIMESTAMP
-                    WHERE category = ? AND user_id = ?
-                    """,
-                    (budget.monthly_limit, budget.category, user["id"])
-                )
-                print(f"[BUDGET] Postgres - updated existing budget")
-            else:
-                # Insert new
-                await db.execute(
-                    """
-                    INSERT INTO budgets (user_id, category, monthly_limit)
-                    VALUES (?, ?, ?)
-                    """,
-                    (user["id"], budget.category, budget.monthly_limit)
-                )
-                print(f"[BUDGET] Postgres - inserted new budget")
-            
-            await db.commit()
-            print(f"[BUDGET] Postgres - commit complete")
-            
-            # Fetch the result
-            fetch_cursor = await db.execute(
-                "SELECT * FROM budgets WHERE category = ? AND user_id = ?",
-                (budget.category, user["id"])
-            )
-        else:
-            # SQLite: Check if exists first (SQLite upsert syntax differs)
-            cursor = await db.execute(
-                "SELECT id FROM budgets WHERE category = ? AND user_id = ?",
-                (budget.category, user["id"])
-            )
-            existing = await cursor.fetchone()
-            
-            if existing:
-                await db.execute(
-                    """
-                    UPDATE budgets 
-                    SET monthly_limit = ?, updated_at = CURRENT_TIMESTAMP
-                    WHERE category = ? AND user_id = ?
-                    """,
-                    (budget.monthly_limit, budget.category, user["id"])
-                )
-                budget_id = existing["id"]
-            else:
-                cursor = await db.execute(
-                    """
-                    INSERT INTO budgets (user_id, category, monthly_limit)
-                    VALUES (?, ?, ?)
-                    """,
-                    (user["id"], budget.category, budget.monthly_limit)
-                )
-                budget_id = cursor.lastrowid
-            
-            await db.commit()
-            
-            # Fetch the result
-            if budget_id:
-                fetch_cursor = await db.execute("SELECT * FROM budgets WHERE id = ?", (budget_id,))
-            else:
-                fetch_cursor = await db.execute(
-                    "SELECT * FROM budgets WHERE category = ? AND user_id = ?",
-                    (budget.category, user["id"])
-                )
+        logger.debug(
+            "Creating budget: category=%s limit=%s user_id=%s",
+            budget.category, budget.monthly_limit, user["id"]
+        )
         
-        row = await fetch_cursor.fetchone()
-        print(f"[BUDGET] Fetch complete: row={'found' if row else 'None'}")
+        # Upsert on UNIQUE(user_id, category) and read the row back in the same statement
+        row = await db.execute_fetchone(
+            """
+            INSERT INTO budgets (user_id, category, monthly_limit)
+            VALUES (?, ?, ?)
+            ON CONFLICT (user_id, category) DO UPDATE
+            SET monthly_limit = EXCLUDED.monthly_limit, updated_at = CURRENT_TIMESTAMP
+            RETURNING id, category, monthly_limit, created_at, updated_at
+            """,
+            (user["id"], budget.category, budget.monthly_limit)
+        )
+        await db.commit()
         
         if not row:
-            print(f"[BUDGET] ERROR: Row not found after insert/update")
+            logger.error("Budget upsert returned no row: category=%s user_id=%s", budget.category, user["id"])
             raise HTTPException(status_code=500, detail="Failed to fetch created budget")
         
-        print(f"[BUDGET] Building response")
         response = BudgetResponse(
             id=row["id"],
             category=row["category"],
@@ -123,14 +58,13 @@ async def create_budget(
             created_at=row["created_at"],
             updated_at=row["updated_at"]
         )
-        print(f"[BUDGET] Success! Returning budget id={response.id}")
+        logger.debug("Saved budget id=%s", response.id)
         return response
         
     except HTTPException:
         raise
     except Exception as e:
-        print(f"[BUDGET] ERROR: {type(e).__name__}: {e}")
-        print(traceback.format_exc())
+        logger.exception("Failed to create budget: category=%s user_id=%s", budget.category, user["id"])
         raise HTTPException(status_code=500, detail=f"Failed to create budget: {str(e)}")
 
 
@@ -140,13 +74,7 @@ async def get_budgets(
     user: dict = Depends(require_auth)
 ):
     """Get all budgets for current user."""
-    cursor = await db.execute(
-        "SELECT * FROM budgets WHERE user_id = ? ORDER BY category",
-        (user["id"],)
-    )
-    rows = await cursor.fetchall()
-    
-    return [dict(row) for row in rows]
+    return json_response(_BUDGET_LIST, await fetch_budgets(db, user["id"]))
 
 
 @router.delete("/{category}", status_code=status.HTTP_204_NO_CONTENT)
@@ -156,19 +84,15 @@ async def delete_budget(
     user: dict = Depends(require_auth)
 ):
     """Delete a budget for a category."""
-    cursor = await db.execute(
-        "SELECT id FROM budgets WHERE category = ? AND user_id = ?",
-        (category, user["id"])
-    )
-    existing = await cursor.fetchone()
+    # Delete directly; the affected row count doubles as the existence check
+    cursor = await db.execute("DELETE FROM budgets WHERE category = ? AND user_id = ?", (category, user["id"]))
     
-    if not existing:
+    if cursor.rowcount == 0:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Budget for category '{category}' not found"
         )
     
-    await db.execute("DELETE FROM budgets WHERE category = ? AND user_id = ?", (category, user["id"]))
     await db.commit()
     
     return None
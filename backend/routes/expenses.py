@@ -10,20 +10,22 @@ import aiosqlite
 import time
 
 from database import get_db
+from dates import month_bounds
 from models import (
     ExpenseCreate,
     ExpenseResponse,
     ExpenseUpdate,
     CategorySuggestion,
-    CategorizationMethod,
 )
+from responses import list_adapter, json_response
 from services.categorizer import get_categorizer
 from services.alerts import check_and_create_budget_alerts
 from dependencies import require_auth
-from calendar import monthrange
 
 router = APIRouter()
 
+_EXPENSE_LIST = list_adapter(ExpenseResponse)
+
 
 @router.post("/", response_model=ExpenseResponse, status_code=status.HTTP_201_CREATED)
 async def create_expense(
@@ -45,7 +47,7 @@ async def create_expense(
         category = expense.category
         ai_suggested_category = None
         confidence_score = None
-        categorization_method = CategorizationMethod.MANUAL.value
+        categorization_method = "manual"
         user_overridden = False
     else:
         # Use AI categorization
@@ -59,7 +61,7 @@ async def create_expense(
         category = suggestion.category
         ai_suggested_category = suggestion.category
         confidence_score = suggestion.confidence
-        categorization_method = suggestion.method.value
+        categorization_method = suggestion.method
         user_overridden = False
         
         # Log AI operation to audit trail
@@ -74,7 +76,7 @@ async def create_expense(
                 "categorize",
                 expense.description,
                 f"{category} ({suggestion.reasoning})",
-                "gemini-2.5-flash" if suggestion.method == CategorizationMethod.AI else "regex",
+                "gemini-2.5-flash" if suggestion.method == "ai" else "regex",
                 confidence_score,
                 latency_ms
             )
@@ -108,11 +110,10 @@ async def create_expense(
     
     # Fetch created expense
     expense_id = cursor.lastrowid
-    cursor = await db.execute(
+    row = await db.execute_fetchone(
         "SELECT * FROM expenses WHERE id = ?",
         (expense_id,)
     )
-    row = await cursor.fetchone()
     
     if not row:
         raise HTTPException(
@@ -125,20 +126,17 @@ async def create_expense(
     
     # Check budget alerts for this category
     today = expense.date
-    month_start = date(today.year, today.month, 1)
-    days_in_month = monthrange(today.year, today.month)[1]
-    month_end = date(today.year, today.month, days_in_month)
+    month_start, month_end, _ = month_bounds(today.year, today.month)
     
     # Get budget for this category and user
-    budget_cursor = await db.execute(
+    budget_row = await db.execute_fetchone(
         "SELECT monthly_limit FROM budgets WHERE category = ? AND user_id = ?",
         (category, user_id)
     )
-    budget_row = await budget_cursor.fetchone()
     
     if budget_row:
         # Calculate total spent this month for this category and user
-        spent_cursor = await db.execute(
+        spent_row = await db.execute_fetchone(
             """
             SELECT COALESCE(SUM(amount), 0) as total
             FROM expenses 
@@ -146,7 +144,6 @@ async def create_expense(
             """,
             (category, month_start, month_end, user_id)
         )
-        spent_row = await spent_cursor.fetchone()
         total_spent = spent_row["total"] if spent_row else 0
         
         # Check and create alerts if thresholds crossed
@@ -268,10 +265,9 @@ async def get_expenses(
     query += " ORDER BY date DESC, created_at DESC LIMIT ? OFFSET ?"
     params.extend([min(limit, 100), skip])
     
-    cursor = await db.execute(query, params)
-    rows = await cursor.fetchall()
+    rows = await db.execute_fetchall(query, params)
     
-    return [dict(row) for row in rows]
+    return json_response(_EXPENSE_LIST, [dict(row) for row in rows])
 
 
 @router.get("/weekly-summary")
@@ -303,8 +299,7 @@ async def get_weekly_summary(
         query += " AND user_id = ?"
         params.append(user["id"])
         
-        cursor = await db.execute(query, params)
-        row = await cursor.fetchone()
+        row = await db.execute_fetchone(query, params)
         total = float(row["total"]) if row else 0
         
         # Create week label
@@ -349,11 +344,10 @@ async def get_expense(
     db: aiosqlite.Connection = Depends(get_db)
 ):
     """Get a specific expense by ID."""
-    cursor = await db.execute(
+    row = await db.execute_fetchone(
         "SELECT * FROM expenses WHERE id = ?",
         (expense_id,)
     )
-    row = await cursor.fetchone()
     
     if not row:
         raise HTTPException(
@@ -380,11 +374,10 @@ async def update_expense(
     If category is changed, marks as user_overridden.
     """
     # Check if expense exists
-    cursor = await db.execute(
+    existing = await db.execute_fetchone(
         "SELECT * FROM expenses WHERE id = ?",
         (expense_id,)
     )
-    existing = await cursor.fetchone()
     
     if not existing:
         raise HTTPException(
@@ -440,11 +433,10 @@ async def update_expense(
     await db.commit()
     
     # Fetch updated expense
-    cursor = await db.execute(
+    row = await db.execute_fetchone(
         "SELECT * FROM expenses WHERE id = ?",
         (expense_id,)
     )
-    row = await cursor.fetchone()
     
     return dict(row)
 
@@ -455,11 +447,10 @@ async def delete_expense(
     db: aiosqlite.Connection = Depends(get_db)
 ):
     """Delete an expense."""
-    cursor = await db.execute(
-        "SELECT id FROM expenses WHERE id = ?",
+    existing = await db.execute_fetchone(
+        "SELECT id, user_id FROM expenses WHERE id = ?",
         (expense_id,)
     )
-    existing = await cursor.fetchone()
     
     if not existing:
         raise HTTPException(
@@ -103,7 +103,7 @@ async def get_gamification_stats(
     async with db.get_connection() as conn:
         # Calculate streak from expense history
         # Get all distinct dates with expenses, ordered by date desc
-        dates_cursor = await conn.execute(
+        date_rows = await conn.execute_fetchall(
             """
             SELECT DISTINCT date FROM expenses 
             WHERE user_id = ? 
@@ -112,14 +112,13 @@ async def get_gamification_stats(
             """,
             (user_id,)
         )
-        date_rows = await dates_cursor.fetchall()
         
         # Calculate current streak
         expense_dates = []
         for row in date_rows:
             d = row['date']
             if isinstance(d, str):
-                d = datetime.strptime(d, "%Y-%m-%d").date()
+                d = date.fromisoformat(d)
             expense_dates.append(d)
         
         current_streak = 0
@@ -164,19 +163,17 @@ async def get_gamification_stats(
         )
         
         # Get total expenses count
-        count_cursor = await conn.execute(
+        count_row = await conn.execute_fetchone(
             "SELECT COUNT(*) as count FROM expenses WHERE user_id = ?",
             (user_id,)
         )
-        count_row = await count_cursor.fetchone()
         total_expenses = count_row['count'] if count_row else 0
         
         # Get completed goals count
-        goals_cursor = await conn.execute(
+        goals_row = await conn.execute_fetchone(
             "SELECT COUNT(*) as count FROM savings_goals WHERE user_id = ? AND is_completed = 1",
             (user_id,)
         )
-        goals_row = await goals_cursor.fetchone()
         goals_completed = goals_row['count'] if goals_row else 0
         
         # Check badges earned
@@ -10,9 +10,12 @@ import aiosqlite
 from database import get_db
 from models import GoalCreate, GoalUpdate, GoalResponse, ContributionCreate, ContributionResponse
 from dependencies import require_auth
+from responses import list_adapter, json_response
 
 router = APIRouter()
 
+_GOAL_LIST = list_adapter(GoalResponse)
+
 
 def calculate_days_remaining(target_date: date | None) -> int | None:
     """Calculate days remaining until target date."""
@@ -73,9 +76,8 @@ async def list_goals(
     
     base_query += " ORDER BY created_at DESC"
     
-    cursor = await db.execute(base_query, params)
-    rows = await cursor.fetchall()
-    return [row_to_goal_response(row) for row in rows]
+    rows = await db.execute_fetchall(base_query, params)
+    return json_response(_GOAL_LIST, [row_to_goal_response(row) for row in rows])
 
 
 @router.post("/", response_model=GoalResponse, status_code=201)
@@ -96,8 +98,7 @@ async def create_goal(
     
     # Fetch the created goal
     goal_id = cursor.lastrowid
-    cursor = await db.execute("SELECT * FROM savings_goals WHERE id = ?", (goal_id,))
-    row = await cursor.fetchone()
+    row = await db.execute_fetchone("SELECT * FROM savings_goals WHERE id = ?", (goal_id,))
     
     return row_to_goal_response(row)
 
@@ -108,8 +109,7 @@ async def get_goal(
     db: aiosqlite.Connection = Depends(get_db)
 ):
     """Get a specific savings goal."""
-    cursor = await db.execute("SELECT * FROM savings_goals WHERE id = ?", (goal_id,))
-    row = await cursor.fetchone()
+    row = await db.execute_fetchone("SELECT * FROM savings_goals WHERE id = ?", (goal_id,))
     
     if not row:
         raise HTTPException(status_code=404, detail="Goal not found")
@@ -125,8 +125,7 @@ async def update_goal(
 ):
     """Update a savings goal."""
     # Check if goal exists
-    cursor = await db.execute("SELECT * FROM savings_goals WHERE id = ?", (goal_id,))
-    existing = await cursor.fetchone()
+    existing = await db.execute_fetchone("SELECT * FROM savings_goals WHERE id = ?", (goal_id,))
     
     if not existing:
         raise HTTPException(status_code=404, detail="Goal not found")
@@ -159,8 +158,7 @@ async def update_goal(
         await db.commit()
     
     # Fetch updated goal
-    cursor = await db.execute("SELECT * FROM savings_goals WHERE id = ?", (goal_id,))
-    row = await cursor.fetchone()
+    row = await db.execute_fetchone("SELECT * FROM savings_goals WHERE id = ?", (goal_id,))
     
     return row_to_goal_response(row)
 
@@ -171,8 +169,8 @@ async def delete_goal(
     db: aiosqlite.Connection = Depends(get_db)
 ):
     """Delete a savings goal."""
-    cursor = await db.execute("SELECT id FROM savings_goals WHERE id = ?", (goal_id,))
-    if not await cursor.fetchone():
+    existing = await db.execute_fetchone("SELECT id, user_id FROM savings_goals WHERE id = ?", (goal_id,))
+    if not existing:
         raise HTTPException(status_code=404, detail="Goal not found")
     
     await db.execute("DELETE FROM savings_goals WHERE id = ?", (goal_id,))
@@ -191,8 +189,7 @@ async def add_contribution(
 ):
     """Add a contribution to a savings goal."""
     # Check if goal exists
-    cursor = await db.execute("SELECT * FROM savings_goals WHERE id = ?", (goal_id,))
-    goal = await cursor.fetchone()
+    goal = await db.execute_fetchone("SELECT * FROM savings_goals WHERE id = ?", (goal_id,))
     
     if not goal:
         raise HTTPException(status_code=404, detail="Goal not found")
@@ -232,8 +229,7 @@ async def add_contribution(
     await db.commit()
     
     # Fetch updated goal
-    cursor = await db.execute("SELECT * FROM savings_goals WHERE id = ?", (goal_id,))
-    row = await cursor.fetchone()
+    row = await db.execute_fetchone("SELECT * FROM savings_goals WHERE id = ?", (goal_id,))
     
     return row_to_goal_response(row)
 
@@ -245,15 +241,13 @@ async def get_contributions(
 ):
     """Get contribution history for a goal."""
     # Check if goal exists
-    cursor = await db.execute("SELECT id FROM savings_goals WHERE id = ?", (goal_id,))
-    if not await cursor.fetchone():
+    if not await db.execute_fetchone("SELECT id FROM savings_goals WHERE id = ?", (goal_id,)):
         raise HTTPException(status_code=404, detail="Goal not found")
     
-    cursor = await db.execute(
+    rows = await db.execute_fetchall(
         "SELECT * FROM goal_contributions WHERE goal_id = ? ORDER BY created_at DESC",
         (goal_id,)
     )
-    rows = await cursor.fetchall()
     
     return [
         ContributionResponse(
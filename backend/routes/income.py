@@ -4,10 +4,11 @@ Income API routes for tracking earnings.
 
 from fastapi import APIRouter, Depends, HTTPException, Query
 from typing import List, Optional
-from datetime import date, datetime, timedelta
+from datetime import date, datetime
 import aiosqlite
 
 from database import get_db
+from dates import month_bounds
 from models import IncomeCreate, IncomeResponse
 from dependencies import get_current_user, require_auth
 
@@ -37,8 +38,7 @@ async def list_income(
     query += " ORDER BY date DESC LIMIT ?"
     params.append(limit)
     
-    cursor = await db.execute(query, tuple(params))
-    rows = await cursor.fetchall()
+    rows = await db.execute_fetchall(query, tuple(params))
     
     return [
         IncomeResponse(
@@ -122,11 +122,11 @@ async def delete_income(
 ):
     """Delete an income entry."""
     # Verify ownership
-    cursor = await db.execute(
+    existing = await db.execute_fetchone(
         "SELECT id FROM incomes WHERE id = ? AND user_id = ?",
         (income_id, user["id"])
     )
-    if not await cursor.fetchone():
+    if not existing:
         raise HTTPException(status_code=404, detail="Income not found")
     
     await db.execute("DELETE FROM incomes WHERE id = ?", (income_id,))
@@ -141,18 +141,15 @@ async def get_income_summary(
     user: dict = Depends(require_auth)
 ):
     """Get total income summary."""
+    today = date.today()
     if not year:
-        year = date.today().year
+        year = today.year
     if not month:
-        month = date.today().month
+        month = today.month
         
-    start_date = date(year, month, 1)
-    if month == 12:
-        end_date = date(year + 1, 1, 1) - timedelta(days=1)
-    else:
-        end_date = date(year, month + 1, 1) - timedelta(days=1)
+    start_date, end_date, _ = month_bounds(year, month)
         
-    cursor = await db.execute(
+    row = await db.execute_fetchone(
         """
         SELECT COALESCE(SUM(amount), 0) as total 
         FROM incomes 
@@ -160,7 +157,6 @@ async def get_income_summary(
         """,
         (user["id"], start_date, end_date)
     )
-    row = await cursor.fetchone()
     total = row["total"] if row else 0
     
     return {
@@ -111,19 +111,17 @@ async def get_nudges(
                 ))
         
         # Calculate spending prediction
-        total_spent_query = await conn.execute(
+        total_spent_row = await conn.execute_fetchone(
             "SELECT COALESCE(SUM(amount), 0) as total FROM expenses WHERE user_id = ? AND date >= ?",
             (user_id, month_start.isoformat())
         )
-        total_spent_row = await total_spent_query.fetchone()
         total_spent = float(total_spent_row['total']) if total_spent_row else 0
         
         # Get total budget
-        total_budget_query = await conn.execute(
+        total_budget_row = await conn.execute_fetchone(
             "SELECT COALESCE(SUM(monthly_limit), 0) as total FROM budgets WHERE user_id = ?",
             (user_id,)
         )
-        total_budget_row = await total_budget_query.fetchone()
         total_budget = float(total_budget_row['total']) if total_budget_row else 0
         
         # Daily spending rate and projection
@@ -158,18 +156,16 @@ async def get_nudges(
         week_ago = today - timedelta(days=7)
         two_weeks_ago = today - timedelta(days=14)
         
-        this_week_query = await conn.execute(
+        this_week_row = await conn.execute_fetchone(
             "SELECT COALESCE(SUM(amount), 0) as total FROM expenses WHERE user_id = ? AND date >= ?",
             (user_id, week_ago.isoformat())
         )
-        this_week_row = await this_week_query.fetchone()
         this_week = float(this_week_row['total']) if this_week_row else 0
         
-        last_week_query = await conn.execute(
+        last_week_row = await conn.execute_fetchone(
             "SELECT COALESCE(SUM(amount), 0) as total FROM expenses WHERE user_id = ? AND date >= ? AND date < ?",
             (user_id, two_weeks_ago.isoformat(), week_ago.isoformat())
         )
-        last_week_row = await last_week_query.fetchone()
         last_week = float(last_week_row['total']) if last_week_row else 0
         
         if last_week > 0:
@@ -24,8 +24,7 @@ router = APIRouter()
 @router.get("/friends", response_model=List[FriendResponse])
 async def list_friends(db: aiosqlite.Connection = Depends(get_db)):
     """List all friends."""
-    cursor = await db.execute("SELECT * FROM friends ORDER BY name")
-    rows = await cursor.fetchall()
+    rows = await db.execute_fetchall("SELECT * FROM friends ORDER BY name")
     return [dict(row) for row in rows]
 
 
@@ -45,8 +44,7 @@ async def create_friend(
     await db.commit()
     
     friend_id = cursor.lastrowid
-    cursor = await db.execute("SELECT * FROM friends WHERE id = ?", (friend_id,))
-    row = await cursor.fetchone()
+    row = await db.execute_fetchone("SELECT * FROM friends WHERE id = ?", (friend_id,))
     return dict(row)
 
 
@@ -56,8 +54,7 @@ async def delete_friend(
     db: aiosqlite.Connection = Depends(get_db)
 ):
     """Remove a friend."""
-    cursor = await db.execute("SELECT id FROM friends WHERE id = ?", (friend_id,))
-    if not await cursor.fetchone():
+    if not await db.execute_fetchone("SELECT id FROM friends WHERE id = ?", (friend_id,)):
         raise HTTPException(status_code=404, detail="Friend not found")
     
     await db.execute("DELETE FROM friends WHERE id = ?", (friend_id,))
@@ -76,14 +73,12 @@ async def split_expense(
 ):
     """Split an expense with friends."""
     # Check if expense exists
-    cursor = await db.execute("SELECT id FROM expenses WHERE id = ?", (expense_id,))
-    if not await cursor.fetchone():
+    if not await db.execute_fetchone("SELECT id FROM expenses WHERE id = ?", (expense_id,)):
         raise HTTPException(status_code=404, detail="Expense not found")
     
     # Validate all friend IDs exist
     for split in request.splits:
-        cursor = await db.execute("SELECT id FROM friends WHERE id = ?", (split.friend_id,))
-        if not await cursor.fetchone():
+        if not await db.execute_fetchone("SELECT id FROM friends WHERE id = ?", (split.friend_id,)):
             raise HTTPException(status_code=404, detail=f"Friend {split.friend_id} not found")
     
     # Insert splits
@@ -99,7 +94,7 @@ async def split_expense(
     await db.commit()
     
     # Fetch created splits with friend names
-    cursor = await db.execute(
+    rows = await db.execute_fetchall(
         """
         SELECT es.*, f.name as friend_name
         FROM expense_splits es
@@ -108,7 +103,6 @@ async def split_expense(
         """,
         (expense_id,)
     )
-    rows = await cursor.fetchall()
     
     return [
         SplitResponse(
@@ -132,7 +126,7 @@ async def split_expense(
 @router.get("/balances", response_model=BalancesResponse)
 async def get_balances(db: aiosqlite.Connection = Depends(get_db)):
     """Get summary of who owes what."""
-    cursor = await db.execute(
+    rows = await db.execute_fetchall(
         """
         SELECT 
             f.id as friend_id,
@@ -149,7 +143,6 @@ async def get_balances(db: aiosqlite.Connection = Depends(get_db)):
         ORDER BY COALESCE(SUM(CASE WHEN es.is_settled = false THEN es.amount ELSE 0 END), 0) DESC
         """
     )
-    rows = await cursor.fetchall()
     
     balances = [
         BalanceSummary(
@@ -177,8 +170,7 @@ async def settle_split(
     db: aiosqlite.Connection = Depends(get_db)
 ):
     """Mark a split as settled (paid)."""
-    cursor = await db.execute("SELECT id FROM expense_splits WHERE id = ?", (split_id,))
-    if not await cursor.fetchone():
+    if not await db.execute_fetchone("SELECT id FROM expense_splits WHERE id = ?", (split_id,)):
         raise HTTPException(status_code=404, detail="Split not found")
     
     await db.execute(
@@ -200,8 +192,7 @@ async def settle_all_with_friend(
     db: aiosqlite.Connection = Depends(get_db)
 ):
     """Settle all splits with a friend."""
-    cursor = await db.execute("SELECT id FROM friends WHERE id = ?", (friend_id,))
-    if not await cursor.fetchone():
+    if not await db.execute_fetchone("SELECT id FROM friends WHERE id = ?", (friend_id,)):
         raise HTTPException(status_code=404, detail="Friend not found")
     
     result = await db.execute(
@@ -227,7 +218,7 @@ async def get_expense_splits(
     db: aiosqlite.Connection = Depends(get_db)
 ):
     """Get all splits for an expense."""
-    cursor = await db.execute(
+    rows = await db.execute_fetchall(
         """
         SELECT es.*, f.name as friend_name
         FROM expense_splits es
@@ -236,7 +227,6 @@ async def get_expense_splits(
         """,
         (expense_id,)
     )
-    rows = await cursor.fetchall()
     
     return [
         SplitResponse(
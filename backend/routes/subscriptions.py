@@ -4,8 +4,8 @@ Track recurring subscriptions and get renewal reminders.
 """
 
 from fastapi import APIRouter, Depends, HTTPException
-from typing import List, Optional
-from datetime import date, datetime, timedelta
+from typing import List
+from datetime import date, timedelta
 import aiosqlite
 
 from database import get_db
@@ -32,17 +32,10 @@ def calculate_days_until(renewal_date: date) -> int:
     """Calculate days until renewal."""
     today = date.today()
     if isinstance(renewal_date, str):
-        renewal_date = datetime.strptime(renewal_date, "%Y-%m-%d").date()
+        renewal_date = date.fromisoformat(renewal_date)
     return (renewal_date - today).days
 
 
-def build_user_filter(user: Optional[dict]) -> tuple[str, list]:
-    """Build SQL filter for user-specific data."""
-    if user:
-        return "user_id = ?", [user["id"]]
-    return "1=1", []
-
-
 @router.get("/", response_model=List[SubscriptionResponse])
 async def get_subscriptions(
     active_only: bool = True,
@@ -50,19 +43,16 @@ async def get_subscriptions(
     user: dict = Depends(require_auth)
 ):
     """Get all subscriptions."""
-    user_filter, user_params = build_user_filter(user)
-    
     active_filter = "AND is_active = 1" if active_only else ""
     
-    cursor = await db.execute(
+    rows = await db.execute_fetchall(
         f"""
         SELECT * FROM subscriptions
-        WHERE {user_filter} {active_filter}
+        WHERE user_id = ? {active_filter}
         ORDER BY next_renewal ASC
         """,
-        tuple(user_params)
+        (user["id"],)
     )
-    rows = await cursor.fetchall()
     
     results = []
     for row in rows:
@@ -86,23 +76,20 @@ async def get_upcoming_renewals(
     user: dict = Depends(require_auth)
 ):
     """Get subscriptions renewing within specified days."""
-    user_filter, user_params = build_user_filter(user)
-    
     today = date.today()
     end_date = today + timedelta(days=days)
     
-    cursor = await db.execute(
-        f"""
+    rows = await db.execute_fetchall(
+        """
         SELECT * FROM subscriptions
-        WHERE {user_filter}
+        WHERE user_id = ?
         AND is_active = 1
         AND next_renewal >= ?
         AND next_renewal <= ?
         ORDER BY next_renewal ASC
         """,
-        (*user_params, today, end_date)
+        (user["id"], today, end_date)
     )
-    rows = await cursor.fetchall()
     
     results = []
     for row in rows:
@@ -124,16 +111,13 @@ async def get_subscriptions_summary(
     user: dict = Depends(require_auth)
 ):
     """Get subscription spending summary."""
-    user_filter, user_params = build_user_filter(user)
-    
-    cursor = await db.execute(
-        f"""
+    rows = await db.execute_fetchall(
+        """
         SELECT * FROM subscriptions
-        WHERE {user_filter} AND is_active = 1
+        WHERE user_id = ? AND is_active = 1
         """,
-        tuple(user_params)
+        (user["id"],)
     )
-    rows = await cursor.fetchall()
     
     total_monthly = 0.0
     total_yearly = 0.0
@@ -169,7 +153,7 @@ async def create_subscription(
             user_id,
             subscription.name,
             subscription.amount,
-            subscription.billing_cycle.value,
+            subscription.billing_cycle,
             subscription.next_renewal,
             subscription.category,
             subscription.reminder_days,
@@ -179,11 +163,10 @@ async def create_subscription(
     await db.commit()
     
     # Fetch the created subscription
-    cursor = await db.execute(
+    row = await db.execute_fetchone(
         "SELECT * FROM subscriptions WHERE id = ?",
         (cursor.lastrowid,)
     )
-    row = await cursor.fetchone()
     
     sub_dict = dict(row)
     sub_dict["days_until_renewal"] = calculate_days_until(sub_dict["next_renewal"])
@@ -216,7 +199,7 @@ async def update_subscription(
         update_values.append(subscription.amount)
     if subscription.billing_cycle is not None:
         update_fields.append("billing_cycle = ?")
-        update_values.append(subscription.billing_cycle.value)
+        update_values.append(subscription.billing_cycle)
     if subscription.next_renewal is not None:
         update_fields.append("next_renewal = ?")
         update_values.append(subscription.next_renewal)
@@ -246,11 +229,10 @@ async def update_subscription(
     await db.commit()
     
     # Fetch updated subscription
-    cursor = await db.execute(
+    row = await db.execute_fetchone(
         "SELECT * FROM subscriptions WHERE id = ?",
         (subscription_id,)
     )
-    row = await cursor.fetchone()
     
     if not row:
         raise HTTPException(status_code=404, detail="Subscription not found")
@@ -273,11 +255,11 @@ async def delete_subscription(
     user: dict = Depends(require_auth)
 ):
     """Delete a subscription."""
-    cursor = await db.execute(
+    existing = await db.execute_fetchone(
         "SELECT id FROM subscriptions WHERE id = ?",
         (subscription_id,)
     )
-    if not await cursor.fetchone():
+    if not existing:
         raise HTTPException(status_code=404, detail="Subscription not found")
     
     await db.execute(
@@ -34,18 +34,17 @@ async def check_and_create_budget_alerts(
     for threshold, emoji, title, message in thresholds:
         if percentage >= threshold:
             # Check if we already triggered this threshold this month
-            cursor = await db.execute(
+            existing = await db.execute_fetchone(
                 """
                 SELECT id FROM budget_alert_tracking 
                 WHERE user_id = ? AND category = ? AND threshold_percent = ? AND month = ?
                 """,
                 (user_id, category, threshold, current_month)
             )
-            existing = await cursor.fetchone()
             
             if not existing:
                 # Create the alert
-                cursor = await db.execute(
+                await db.execute(
                     """
                     INSERT INTO alerts (user_id, type, title, message, category, threshold_percent)
                     VALUES (?, ?, ?, ?, ?, ?)
@@ -76,28 +75,51 @@ async def check_and_create_budget_alerts(
     return new_alerts
 
 
-async def get_unread_alerts(db: aiosqlite.Connection, user_id: int, limit: int = 10) -> list[dict]:
-    """Get unread and not dismissed alerts for a specific user."""
-    cursor = await db.execute(
+async def get_unread_with_count(
+    db: aiosqlite.Connection,
+    user_id: int,
+    limit: int = 10
+) -> tuple[list[dict], int]:
+    """
+    Get the latest not-dismissed alerts together with the user's unread count.
+    The count is a window aggregate over the same scan, so both come back in one query.
+    """
+    if limit <= 0:
+        return [], await get_unread_count(db, user_id)
+    
+    rows = await db.execute_fetchall(
         """
-        SELECT * FROM alerts 
+        SELECT 
+            id, type, title, message, category, threshold_percent,
+            COALESCE(is_read, FALSE) as is_read,
+            COALESCE(is_dismissed, FALSE) as is_dismissed,
+            created_at,
+            COUNT(*) FILTER (WHERE is_read = FALSE) OVER () as unread_count
+        FROM alerts 
         WHERE user_id = ? AND is_dismissed = FALSE 
         ORDER BY created_at DESC 
         LIMIT ?
         """,
         (user_id, limit)
     )
-    rows = await cursor.fetchall()
-    return [dict(row) for row in rows]
+    if not rows:
+        return [], 0
+    
+    unread_count = rows[0]["unread_count"]
+    alerts = []
+    for row in rows:
+        alert = dict(row)
+        del alert["unread_count"]
+        alerts.append(alert)
+    return alerts, unread_count
 
 
 async def get_unread_count(db: aiosqlite.Connection, user_id: int) -> int:
     """Get count of unread alerts for a specific user."""
-    cursor = await db.execute(
+    row = await db.execute_fetchone(
         "SELECT COUNT(*) FROM alerts WHERE user_id = ? AND is_read = FALSE AND is_dismissed = FALSE",
         (user_id,)
     )
-    row = await cursor.fetchone()
     return row[0] if row else 0
 
 
@@ -4,9 +4,11 @@ PostgreSQL-only implementation.
 """
 
 from datetime import datetime, timedelta
-from typing import Optional, Any
+from typing import Optional, Any, Dict, Tuple
 import hashlib
+import hmac
 import secrets
+import time
 import jwt
 import os
 
@@ -14,8 +16,24 @@ import os
 # Use persistent key from env, or fallback to random (logs everyone out on restart)
 SECRET_KEY = os.getenv("JWT_SECRET", "finlens-secret-key-change-in-production-" + secrets.token_hex(16))
 ALGORITHM = "HS256"
+_SECRET_KEY_BYTES = SECRET_KEY.encode("utf-8")
+# Only our own HS256 tokens are accepted, and every one carries exp and sub
+_ALGORITHMS = [ALGORITHM]
+_DECODE_OPTIONS = {"require": ["exp", "sub"]}
 ACCESS_TOKEN_EXPIRE_MINUTES = 60 * 24  # 24 hours
 
+# Verified token payloads, so repeat requests skip the signature check:
+# token -> (expires_at epoch seconds, payload or None for a rejected token)
+TOKEN_CACHE_TTL_SECONDS = 60
+_INVALID_TOKEN_TTL_SECONDS = 5
+_TOKEN_CACHE_SIZE = 10000
+_token_cache: Dict[str, Tuple[float, Optional[dict]]] = {}
+
+# Authenticated requests re-read the user row; keep it briefly: user_id -> (expires_at, user)
+USER_CACHE_TTL_SECONDS = 30
+_USER_CACHE_SIZE = 10000
+_user_cache: Dict[int, Tuple[float, dict]] = {}
+
 
 def hash_password(password: str) -> str:
     """Hash a password using SHA-256 with salt."""
@@ -28,50 +46,104 @@ def verify_password(password: str, password_hash: str) -> bool:
     """Verify a password against its hash."""
     try:
         salt, hashed = password_hash.split(":")
-        return hashlib.sha256((password + salt).encode()).hexdigest() == hashed
+        return safe_token_eq(hashlib.sha256((password + salt).encode()).hexdigest(), hashed)
     except ValueError:
         return False
 
 
+def safe_token_eq(a: str, b: str) -> bool:
+    """
+    Compare secrets in constant time for equal-length inputs.
+    A length mismatch returns early; lengths here are fixed by format, not secret.
+    """
+    return len(a) == len(b) and hmac.compare_digest(a, b)
+
+
+def normalize_email(email: str) -> str:
+    """Canonical form used to store and look up emails."""
+    return email.strip().lower()
+
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     """Create a JWT access token."""
     to_encode = data.copy()
     expire = datetime.utcnow() + (expires_delta or timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES))
     to_encode.update({"exp": expire})
-    return jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
+    return jwt.encode(to_encode, _SECRET_KEY_BYTES, algorithm=ALGORITHM)
 
 
 def decode_token(token: str) -> Optional[dict]:
-    """Decode and validate a JWT token."""
+    """
+    Decode and validate a JWT token.
+    Results are cached briefly per token string; a valid payload is never
+    served past the token's own exp claim.
+    """
+    now = time.time()
+    entry = _token_cache.get(token)
+    if entry is not None and entry[0] > now:
+        return entry[1]
+    
     try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        return payload
+        payload = jwt.decode(token, _SECRET_KEY_BYTES, algorithms=_ALGORITHMS, options=_DECODE_OPTIONS)
+        expires_at = min(now + TOKEN_CACHE_TTL_SECONDS, payload.get("exp", now + TOKEN_CACHE_TTL_SECONDS))
     except jwt.ExpiredSignatureError:
-        return None
+        payload = None
+        expires_at = now + _INVALID_TOKEN_TTL_SECONDS
     except jwt.InvalidTokenError:
-        return None
+        payload = None
+        expires_at = now + _INVALID_TOKEN_TTL_SECONDS
+    
+    if len(_token_cache) >= _TOKEN_CACHE_SIZE:
+        _token_cache.clear()
+    _token_cache[token] = (expires_at, payload)
+    return payload
 
 
 async def get_user_by_email(db: Any, email: str) -> Optional[dict]:
     """Get user by email."""
-    cursor = await db.execute(
+    row = await db.execute_fetchone(
         "SELECT * FROM users WHERE email = ?",
         (email,)
     )
-    row = await cursor.fetchone()
     return dict(row) if row else None
 
 
 async def get_user_by_id(db: Any, user_id: int) -> Optional[dict]:
     """Get user by ID."""
-    cursor = await db.execute(
+    row = await db.execute_fetchone(
         "SELECT * FROM users WHERE id = ?",
         (user_id,)
     )
-    row = await cursor.fetchone()
     return dict(row) if row else None
 
 
+async def get_cached_user(db: Any, user_id: int) -> Optional[dict]:
+    """Get user by ID, served from a short-lived in-process cache when possible."""
+    entry = _user_cache.get(user_id)
+    if entry is not None and entry[0] > time.monotonic():
+        return entry[1]
+    
+    user = await get_user_by_id(db, user_id)
+    if user is None:
+        _user_cache.pop(user_id, None)
+        return None
+    
+    _cache_user(user)
+    return user
+
+
+def _cache_user(user: dict) -> None:
+    """Store a freshly read user row in the auth cache."""
+    if len(_user_cache) >= _USER_CACHE_SIZE:
+        _user_cache.clear()
+    _user_cache[user["id"]] = (time.monotonic() + USER_CACHE_TTL_SECONDS, user)
+
+
+def invalidate_user(user_id: int) -> None:
+    """Drop a user's cached row after it changes or is deleted."""
+    _user_cache.pop(user_id, None)
+
+
 async def create_user(db: Any, email: str, password: str, name: str) -> dict:
     """Create a new user."""
     password_hash = hash_password(password)
@@ -86,7 +158,8 @@ async def create_user(db: Any, email: str, password: str, name: str) -> dict:
     await db.commit()
     
     user_id = cursor.lastrowid
-    return await get_user_by_id(db, user_id)
+    # The new account's first authenticated request follows right after signup
+    return await get_cached_user(db, user_id)
 
 
 async def authenticate_user(db: Any, email: str, password: str) -> Optional[dict]:
@@ -98,4 +171,5 @@ async def authenticate_user(db: Any, email: str, password: str) -> Optional[dict
         return None
     if not user["is_active"]:
         return None
+    _cache_user(user)
     return user
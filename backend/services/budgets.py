@@ -0,0 +1,14 @@
+"""
+Budget queries shared by the budgets and bootstrap routes.
+"""
+
+from typing import Any, List
+
+
+async def fetch_budgets(db: Any, user_id: int) -> List[dict]:
+    """Get a user's budgets ordered by category, shaped for BudgetResponse."""
+    rows = await db.execute_fetchall(
+        "SELECT id, category, monthly_limit, created_at, updated_at FROM budgets WHERE user_id = ? ORDER BY category",
+        (user_id,)
+    )
+    return [dict(row) for row in rows]
@@ -0,0 +1,42 @@
+"""
+Category list shared by the categories and bootstrap routes.
+"""
+
+from typing import List, Optional
+
+from database import db
+from models import CategoryResponse
+from responses import list_adapter
+
+_CATEGORY_LIST = list_adapter(CategoryResponse)
+
+# Categories are seeded at startup and no route writes them, so the list is
+# loaded once and served from memory for the life of the process
+_categories: Optional[List[CategoryResponse]] = None
+_categories_body: Optional[bytes] = None
+
+
+async def _load_categories() -> None:
+    """Read the category list and its encoded JSON into the cache."""
+    global _categories, _categories_body
+    # Borrow a connection only on a miss so cached calls never wait on the pool
+    async with db.get_connection() as connection:
+        rows = await connection.execute_fetchall(
+            "SELECT id, name, icon, color, description FROM categories ORDER BY name"
+        )
+    _categories = _CATEGORY_LIST.validate_python([dict(row) for row in rows])
+    _categories_body = _CATEGORY_LIST.dump_json(_categories)
+
+
+async def get_categories() -> List[CategoryResponse]:
+    """All categories ordered by name."""
+    if _categories is None:
+        await _load_categories()
+    return _categories
+
+
+async def get_categories_json() -> bytes:
+    """All categories ordered by name, as pre-encoded JSON."""
+    if _categories_body is None:
+        await _load_categories()
+    return _categories_body
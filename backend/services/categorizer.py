@@ -12,7 +12,7 @@ from typing import Optional, List, Tuple, Dict, Any
 from datetime import datetime, timedelta
 from dataclasses import dataclass
 
-from models import CategorySuggestion, CategorizationMethod
+from models import CategorySuggestion
 from services.gemini_client import get_gemini_client
 
 
@@ -356,7 +356,7 @@ Confidence should be:
             return CategorySuggestion(
                 category="Other",
                 confidence=0.1,
-                method=CategorizationMethod.REGEX,
+                method="regex",
                 reasoning="Empty description"
             )
         
@@ -370,7 +370,7 @@ Confidence should be:
             return CategorySuggestion(
                 category=category,
                 confidence=confidence,
-                method=CategorizationMethod.REGEX,
+                method="regex",
                 reasoning=f"Matched pattern for {category}"
             )
         
@@ -391,7 +391,7 @@ Confidence should be:
         result = CategorySuggestion(
             category=category,
             confidence=confidence,
-            method=CategorizationMethod.AI,
+            method="ai",
             reasoning=reasoning
         )
         
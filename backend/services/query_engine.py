@@ -371,25 +371,23 @@ class QueryEngine:
         
         try:
             # Get monthly income
-            cursor = await db.execute("""
+            row = await db.execute_fetchone("""
                 SELECT COALESCE(SUM(amount), 0) as total
                 FROM incomes
                 WHERE user_id = $1 AND date >= $2 AND date <= $3
             """, (user_id, month_start, today))
-            row = await cursor.fetchone()
             context["monthly_income"] = float(row["total"]) if row else 0
             
             # Get monthly expenses
-            cursor = await db.execute("""
+            row = await db.execute_fetchone("""
                 SELECT COALESCE(SUM(amount), 0) as total
                 FROM expenses
                 WHERE user_id = $1 AND date >= $2 AND date <= $3
             """, (user_id, month_start, today))
-            row = await cursor.fetchone()
             context["monthly_expenses"] = float(row["total"]) if row else 0
             
             # Get spending by category
-            cursor = await db.execute("""
+            rows = await db.execute_fetchall("""
                 SELECT category, SUM(amount) as total
                 FROM expenses
                 WHERE user_id = $1 AND date >= $2 AND date <= $3
@@ -397,27 +395,24 @@ class QueryEngine:
                 ORDER BY total DESC
                 LIMIT 5
             """, (user_id, month_start, today))
-            rows = await cursor.fetchall()
             context["top_categories"] = [{"category": r["category"], "amount": float(r["total"])} for r in rows]
             
             # Get budget limits
-            cursor = await db.execute("""
+            rows = await db.execute_fetchall("""
                 SELECT category, monthly_limit
                 FROM budgets
                 WHERE user_id = $1
             """, (user_id,))
-            rows = await cursor.fetchall()
             context["budgets"] = [{"category": r["category"], "limit": float(r["monthly_limit"])} for r in rows]
             context["total_budget_limit"] = sum(float(r["monthly_limit"]) for r in rows)
             
             # Get active goals
-            cursor = await db.execute("""
+            rows = await db.execute_fetchall("""
                 SELECT name, target_amount, current_amount, target_date
                 FROM savings_goals
                 WHERE user_id = $1 AND is_completed = FALSE
                 LIMIT 3
             """, (user_id,))
-            rows = await cursor.fetchall()
             context["goals"] = [
                 {
                     "name": r["name"],
@@ -429,7 +424,7 @@ class QueryEngine:
             ]
             
             # Get subscription costs
-            cursor = await db.execute("""
+            row = await db.execute_fetchone("""
                 SELECT COALESCE(SUM(
                     CASE 
                         WHEN billing_cycle = 'monthly' THEN amount
@@ -441,7 +436,6 @@ class QueryEngine:
                 FROM subscriptions
                 WHERE user_id = $1 AND is_active = TRUE
             """, (user_id,))
-            row = await cursor.fetchone()
             context["monthly_subscriptions"] = float(row["monthly_total"]) if row else 0
             
             # Calculate net savings potential
@@ -810,8 +804,7 @@ Respond with JSON:
         param_values = tuple(params.get(p) for p in param_order)
         
         # Execute query using positional parameters
-        cursor = await db.execute(sql, param_values)
-        rows = await cursor.fetchall()
+        rows = await db.execute_fetchall(sql, param_values)
         
         return [dict(row) for row in rows]
     
@@ -0,0 +1,71 @@
+"""
+Short-lived per-user cache for computed analytics responses.
+Dashboard widgets poll these endpoints; entries are keyed by the response's
+ETag, which covers the user's data fingerprint, so a write simply makes the
+old entries unreachable until they expire.
+"""
+
+import time
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+
+class ResponseCache:
+    """
+    In-memory TTL cache grouped by user.
+    Entries expire after ttl_seconds; a user's expired entries are pruned
+    whenever a new one is stored for them.
+    """
+
+    def __init__(self, ttl_seconds: float = 30, max_users: int = 10000):
+        """
+        Initialize cache.
+
+        Args:
+            ttl_seconds: Time-to-live for cache entries (default: 30 seconds)
+            max_users: Maximum number of users with cached entries
+        """
+        self.ttl_seconds = ttl_seconds
+        self.max_users = max_users
+        self._cache: Dict[int, Dict[Hashable, Tuple[float, Any]]] = {}
+
+    def get(self, user_id: int, key: Hashable) -> Optional[Any]:
+        """Get a cached value if available and not expired."""
+        entry = self._cache.get(user_id, {}).get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if time.monotonic() >= expires_at:
+            del self._cache[user_id][key]
+            return None
+        return value
+
+    def set(self, user_id: int, key: Hashable, value: Any) -> None:
+        """Store a value for a user."""
+        if user_id not in self._cache and len(self._cache) >= self.max_users:
+            self._evict_expired()
+            if len(self._cache) >= self.max_users:
+                self._cache.clear()
+
+        now = time.monotonic()
+        entries = self._cache.setdefault(user_id, {})
+        for stale_key in [k for k, (expires_at, _) in entries.items() if expires_at <= now]:
+            del entries[stale_key]
+        entries[key] = (now + self.ttl_seconds, value)
+
+    def _evict_expired(self) -> None:
+        """Remove users whose entries have all expired."""
+        now = time.monotonic()
+        for user_id in [
+            user_id for user_id, entries in self._cache.items()
+            if all(expires_at <= now for expires_at, _ in entries.values())
+        ]:
+            del self._cache[user_id]
+
+    def clear(self) -> None:
+        """Clear all cache entries."""
+        self._cache.clear()
+
+
+# Global cache instance for analytics responses
+analytics_cache = ResponseCache()
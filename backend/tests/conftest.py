@@ -62,13 +62,13 @@ def mock_categorizer():
     """
     Create a mock categorizer that returns predictable results.
     """
-    from models import CategorySuggestion, CategorizationMethod
+    from models import CategorySuggestion
     
     mock = AsyncMock()
     mock.categorize = AsyncMock(return_value=CategorySuggestion(
         category="Food & Dining",
         confidence=0.95,
-        method=CategorizationMethod.REGEX,
+        method="regex",
         reasoning="Test categorization"
     ))
     
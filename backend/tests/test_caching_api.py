@@ -0,0 +1,240 @@
+"""
+API tests for conditional GETs, cached responses and single-statement writes.
+
+These run against the PostgreSQL database named by DATABASE_URL.
+Run with: pytest tests/test_caching_api.py -v
+"""
+
+import uuid
+from datetime import date
+
+import pytest
+import pytest_asyncio
+from httpx import AsyncClient, ASGITransport
+
+import sys
+sys.path.insert(0, '.')
+from main import app
+
+
+@pytest_asyncio.fixture
+async def client():
+    """Create a test client with the app's startup and shutdown running."""
+    async with app.router.lifespan_context(app):
+        transport = ASGITransport(app=app)
+        async with AsyncClient(transport=transport, base_url="http://test") as ac:
+            yield ac
+
+
+@pytest_asyncio.fixture
+async def auth_headers(client):
+    """Sign up a fresh user and return their Authorization header."""
+    response = await client.post("/api/auth/signup", json={
+        "email": f"user-{uuid.uuid4().hex[:12]}@example.com",
+        "password": "testpass123",
+        "name": "Test User"
+    })
+    assert response.status_code == 201
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+
+async def create_expense(client, headers, amount: float, category: str = "Shopping"):
+    """Create an expense dated today in a fixed category."""
+    response = await client.post("/api/expenses/", json={
+        "amount": amount,
+        "description": "Test expense",
+        "date": date.today().isoformat(),
+        "category": category
+    }, headers=headers)
+    assert response.status_code == 201
+    return response.json()
+
+
+# ============================================================================
+# Conditional GET Tests
+# ============================================================================
+
+class TestAnalyticsETag:
+    """ETag round trips on the analytics routes."""
+
+    @pytest.mark.asyncio
+    async def test_matching_etag_returns_304(self, client, auth_headers):
+        """A repeat request with the returned ETag gets an empty 304."""
+        first = await client.get("/api/analytics/summary", headers=auth_headers)
+        assert first.status_code == 200
+        etag = first.headers["etag"]
+
+        second = await client.get(
+            "/api/analytics/summary",
+            headers={**auth_headers, "If-None-Match": etag}
+        )
+        assert second.status_code == 304
+        assert second.headers["etag"] == etag
+        assert second.content == b""
+
+    @pytest.mark.asyncio
+    async def test_write_changes_etag_and_body(self, client, auth_headers):
+        """A write yields a new ETag and a body that reflects it, not a cached one."""
+        first = await client.get("/api/analytics/summary", headers=auth_headers)
+        assert first.json()["total_expenses"] == 0
+
+        await create_expense(client, auth_headers, 40.0)
+
+        second = await client.get(
+            "/api/analytics/summary",
+            headers={**auth_headers, "If-None-Match": first.headers["etag"]}
+        )
+        assert second.status_code == 200
+        assert second.headers["etag"] != first.headers["etag"]
+        assert second.json()["total_expenses"] == 40.0
+
+    @pytest.mark.asyncio
+    async def test_query_string_variants_have_own_etag(self, client, auth_headers):
+        """Different date ranges never share a tag or a cached body."""
+        default_range = await client.get("/api/analytics/summary", headers=auth_headers)
+        single_day = await client.get(
+            f"/api/analytics/summary?start_date={date.today()}&end_date={date.today()}",
+            headers=auth_headers
+        )
+        assert default_range.headers["etag"] != single_day.headers["etag"]
+
+
+class TestBudgetStatusETag:
+    """ETag round trips on /alerts/budget-status."""
+
+    @pytest.mark.asyncio
+    async def test_matching_etag_returns_304(self, client, auth_headers):
+        """A repeat request with the returned ETag gets an empty 304."""
+        await client.post("/api/budgets/", json={"category": "Shopping", "monthly_limit": 100}, headers=auth_headers)
+
+        first = await client.get("/api/alerts/budget-status", headers=auth_headers)
+        assert first.status_code == 200
+        etag = first.headers["etag"]
+
+        second = await client.get(
+            "/api/alerts/budget-status",
+            headers={**auth_headers, "If-None-Match": etag}
+        )
+        assert second.status_code == 304
+        assert second.content == b""
+
+    @pytest.mark.asyncio
+    async def test_expense_updates_status(self, client, auth_headers):
+        """Spending against a budget changes the tag and the reported spending."""
+        await client.post("/api/budgets/", json={"category": "Shopping", "monthly_limit": 100}, headers=auth_headers)
+        first = await client.get("/api/alerts/budget-status", headers=auth_headers)
+        assert first.json()[0]["current_spending"] == 0
+
+        await create_expense(client, auth_headers, 60.0)
+
+        second = await client.get(
+            "/api/alerts/budget-status",
+            headers={**auth_headers, "If-None-Match": first.headers["etag"]}
+        )
+        assert second.status_code == 200
+        assert second.json()[0]["current_spending"] == 60.0
+        assert second.json()[0]["alert_level"] == "warning"
+
+
+# ============================================================================
+# Budget Write Tests
+# ============================================================================
+
+class TestBudgetWrites:
+    """Budget upsert and delete."""
+
+    @pytest.mark.asyncio
+    async def test_create_then_update_same_category(self, client, auth_headers):
+        """Posting an existing category updates it in place."""
+        created = await client.post("/api/budgets/", json={"category": "Shopping", "monthly_limit": 100}, headers=auth_headers)
+        assert created.status_code == 201
+
+        updated = await client.post("/api/budgets/", json={"category": "Shopping", "monthly_limit": 250}, headers=auth_headers)
+        assert updated.status_code == 201
+        assert updated.json()["id"] == created.json()["id"]
+        assert updated.json()["monthly_limit"] == 250
+
+        budgets = (await client.get("/api/budgets/", headers=auth_headers)).json()
+        assert [(b["category"], b["monthly_limit"]) for b in budgets] == [("Shopping", 250)]
+
+    @pytest.mark.asyncio
+    async def test_delete_budget(self, client, auth_headers):
+        """Deleting returns 204, and deleting again returns 404."""
+        await client.post("/api/budgets/", json={"category": "Shopping", "monthly_limit": 100}, headers=auth_headers)
+
+        response = await client.delete("/api/budgets/Shopping", headers=auth_headers)
+        assert response.status_code == 204
+
+        response = await client.delete("/api/budgets/Shopping", headers=auth_headers)
+        assert response.status_code == 404
+
+    @pytest.mark.asyncio
+    async def test_delete_other_users_budget(self, client, auth_headers):
+        """A budget owned by someone else is reported as not found."""
+        await client.post("/api/budgets/", json={"category": "Shopping", "monthly_limit": 100}, headers=auth_headers)
+
+        other = await client.post("/api/auth/signup", json={
+            "email": f"other-{uuid.uuid4().hex[:12]}@example.com",
+            "password": "testpass123",
+            "name": "Other User"
+        })
+        other_headers = {"Authorization": f"Bearer {other.json()['access_token']}"}
+
+        response = await client.delete("/api/budgets/Shopping", headers=other_headers)
+        assert response.status_code == 404
+
+
+# ============================================================================
+# Combined Read Tests
+# ============================================================================
+
+class TestBootstrap:
+    """Tests for /auth/bootstrap."""
+
+    @pytest.mark.asyncio
+    async def test_matches_individual_endpoints(self, client, auth_headers):
+        """The payload equals /auth/me, /budgets/ and /categories/ combined."""
+        await client.post("/api/budgets/", json={"category": "Shopping", "monthly_limit": 100}, headers=auth_headers)
+
+        response = await client.get("/api/auth/bootstrap", headers=auth_headers)
+        assert response.status_code == 200
+        assert response.json() == {
+            "user": (await client.get("/api/auth/me", headers=auth_headers)).json(),
+            "budgets": (await client.get("/api/budgets/", headers=auth_headers)).json(),
+            "categories": (await client.get("/api/categories/")).json(),
+        }
+
+    @pytest.mark.asyncio
+    async def test_requires_auth(self, client):
+        """Bootstrap without a token is rejected."""
+        response = await client.get("/api/auth/bootstrap")
+        assert response.status_code == 401
+
+
+class TestAlertsSummary:
+    """Tests for the unread count returned with the alerts list."""
+
+    @pytest.mark.asyncio
+    async def test_new_user_has_no_alerts(self, client, auth_headers):
+        """A new user gets an empty list and a zero count."""
+        response = await client.get("/api/alerts/", headers=auth_headers)
+        assert response.status_code == 200
+        assert response.json() == {"unread_count": 0, "alerts": []}
+
+    @pytest.mark.asyncio
+    async def test_unread_count_tracks_alerts(self, client, auth_headers):
+        """Crossing budget thresholds raises unread alerts; mark-all-read clears the count."""
+        await client.post("/api/budgets/", json={"category": "Shopping", "monthly_limit": 100}, headers=auth_headers)
+        await create_expense(client, auth_headers, 85.0)
+
+        summary = (await client.get("/api/alerts/", headers=auth_headers)).json()
+        assert summary["unread_count"] > 0
+        assert summary["unread_count"] == sum(1 for alert in summary["alerts"] if not alert["is_read"])
+
+        await client.post("/api/alerts/mark-all-read", headers=auth_headers)
+        summary = (await client.get("/api/alerts/", headers=auth_headers)).json()
+        assert summary["unread_count"] == 0
+
+        # limit=0 still reports the count without returning rows
+        summary = (await client.get("/api/alerts/?limit=0", headers=auth_headers)).json()
+        assert summary == {"unread_count": 0, "alerts": []}
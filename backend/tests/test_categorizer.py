@@ -12,7 +12,6 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from services.categorizer import HybridCategorizer, get_categorizer
-from models import CategorizationMethod
 
 
 class TestRegexCategorization:
@@ -38,7 +37,7 @@ class TestRegexCategorization:
         for desc in food_descriptions:
             result = await categorizer.categorize(desc)
             assert result.category == "Food & Dining", f"Failed for: {desc}"
-            assert result.method == CategorizationMethod.REGEX
+            assert result.method == "regex"
             assert result.confidence >= 0.9
 
     @pytest.mark.asyncio
@@ -55,7 +54,7 @@ class TestRegexCategorization:
         for desc in transport_descriptions:
             result = await categorizer.categorize(desc)
             assert result.category == "Transportation", f"Failed for: {desc}"
-            assert result.method == CategorizationMethod.REGEX
+            assert result.method == "regex"
 
     @pytest.mark.asyncio
     async def test_shopping_keywords(self, categorizer):
@@ -70,7 +69,7 @@ class TestRegexCategorization:
         for desc in shopping_descriptions:
             result = await categorizer.categorize(desc)
             assert result.category == "Shopping", f"Failed for: {desc}"
-            assert result.method == CategorizationMethod.REGEX
+            assert result.method == "regex"
 
     @pytest.mark.asyncio
     async def test_entertainment_keywords(self, categorizer):
@@ -86,7 +85,7 @@ class TestRegexCategorization:
         for desc in entertainment_descriptions:
             result = await categorizer.categorize(desc)
             assert result.category == "Entertainment", f"Failed for: {desc}"
-            assert result.method == CategorizationMethod.REGEX
+            assert result.method == "regex"
 
     @pytest.mark.asyncio
     async def test_bills_utilities_keywords(self, categorizer):
@@ -102,7 +101,7 @@ class TestRegexCategorization:
         for desc in bills_descriptions:
             result = await categorizer.categorize(desc)
             assert result.category == "Bills & Utilities", f"Failed for: {desc}"
-            assert result.method == CategorizationMethod.REGEX
+            assert result.method == "regex"
 
     @pytest.mark.asyncio
     async def test_healthcare_keywords(self, categorizer):
@@ -118,7 +117,7 @@ class TestRegexCategorization:
         for desc in healthcare_descriptions:
             result = await categorizer.categorize(desc)
             assert result.category == "Healthcare", f"Failed for: {desc}"
-            assert result.method == CategorizationMethod.REGEX
+            assert result.method == "regex"
 
 
 class TestConfidenceScoring: